@@ -0,0 +1,103 @@
+"""
+Benchmarks of the menu's memory use and start-up time.
+
+They take too long, and depend too much on the machine, to be part of the tests.
+Run them with ``python benchmarks/benchmark.py``. Each one prints what it measured,
+and the script exits with status 1 if any of them is slower or bigger than what
+it's compared to.
+"""
+
+from __future__ import annotations
+
+import shutil
+import subprocess
+import sys
+import time
+import tracemalloc
+
+from cursesmenu.items import CommandItem, MenuItem
+
+# Modules that take a while to import, and that a menu doesn't need until it uses them
+SLOW_MODULES = {"asyncio", "concurrent.futures", "importlib.metadata", "subprocess"}
+
+
+class DictItem(MenuItem):
+    """An item that has a __dict__, like the items did before they had slots."""
+
+
+def item_memory(count: int = 10000) -> bool:
+    """Measure the memory that an item takes, which is most of a big menu's."""
+    texts = [f"item {i}" for i in range(count)]
+    sizes = {}
+    for item_class in (MenuItem, DictItem):
+        tracemalloc.start()
+        items = [item_class(text) for text in texts]
+        sizes[item_class], _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        del items
+    print(f"MenuItem: {sizes[MenuItem] // count} bytes")
+    print(f"MenuItem with a __dict__: {sizes[DictItem] // count} bytes")
+    return sizes[MenuItem] < sizes[DictItem]
+
+
+def command_start_time(runs: int = 20) -> bool:
+    """Measure how long starting a command takes, most of a quick command's run."""
+    if shutil.which("env") is None:
+        print("Skipped the start time of commands, env isn't installed")
+        return True
+    # Whether each way of starting the command uses a shell, and posix_spawn
+    options = {
+        "shell": (True, False),
+        "exec": (False, False),
+        "posix_spawn": (False, True),
+    }
+    times = {}
+    for name, (shell, posix_spawn) in options.items():
+        # env is an executable rather than a builtin, so the shell has to start it too
+        item = CommandItem(
+            name,
+            "env",
+            arguments=["true"],
+            shell=shell,
+            posix_spawn=posix_spawn,
+        )
+        start = time.perf_counter()
+        for _ in range(runs):
+            item.run_quietly()
+        times[name] = (time.perf_counter() - start) / runs
+        print(f"Start time with {name}: {times[name] * 1e6:.0f} us")
+    return times["exec"] < times["shell"] and times["posix_spawn"] < times["shell"]
+
+
+def import_time() -> bool:
+    """Measure the import, most of the start-up time of a short-lived picker."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import cursesmenu"],
+        capture_output=True,
+        check=True,
+        text=True,
+    )
+    times = {}
+    for line in result.stderr.splitlines():
+        parts = line.replace(":", "|").split("|")
+        _, _, cumulative, name = (part.strip() for part in parts)
+        if cumulative.isdigit():
+            times[name] = int(cumulative)
+    print(f"Import time: {times['cursesmenu']} us")
+    return not SLOW_MODULES & set(times)
+
+
+def main() -> int:
+    """Run every benchmark, and report the ones that failed."""
+    failed = [
+        benchmark.__name__
+        for benchmark in (item_memory, command_start_time, import_time)
+        if not benchmark()
+    ]
+    if failed:
+        print(f"Failed: {', '.join(failed)}")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,12 +1,28 @@
-import sys
-from importlib import metadata
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
 
-from . import items
 from .curses_menu import CursesMenu
 from .item_group import ItemGroup
 
+if TYPE_CHECKING:
+    from . import items  # noqa: TCH004
+
 __all__ = ["CursesMenu", "ItemGroup", "items"]
 
-__version__ = metadata.version("curses-menu")
 
-del metadata, sys
+def __getattr__(name: str) -> Any:  # noqa: ANN401
+    # The version and the items are only looked up when they're first used, so
+    # that importing the package is quick
+    if name == "__version__":
+        from importlib import metadata
+
+        version = metadata.version("curses-menu")
+        globals()[name] = version
+        return version
+    if name == "items":
+        import importlib
+
+        return importlib.import_module(".items", __name__)
+    msg = f"module {__name__!r} has no attribute {name!r}"
+    raise AttributeError(msg)
@@ -0,0 +1,83 @@
+"""Running several command items at the same time."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+    from concurrent.futures import Future
+
+    from cursesmenu.items.command_item import CommandItem
+
+
+class BatchRunner:
+    """
+    Runs several command items in the background, a few at a time.
+
+    Each command is run with :meth:`~cursesmenu.items.CommandItem.run_quietly`, so
+    the items show their progress and exit status in the menu. Like a
+    :class:`~cursesmenu.items.FunctionItem` running in the background, the runner is
+    polled by the menu, which gets its return value when every command has finished.
+
+    Items that are already running, e.g. in another batch, are skipped rather than
+    run twice.
+
+    :param items: The items to run
+    :param max_workers: The most commands to run at once
+    """
+
+    def __init__(self, items: Iterable[CommandItem], max_workers: int = 4) -> None:
+        """Initialize the runner."""
+        self.items = list(items)
+        self.max_workers = max_workers
+        self.should_exit = False
+        # None until it's started, and again once it's been polled as finished
+        self._futures: list[Future[int]] | None = None
+
+    @property
+    def running(self) -> bool:
+        """Check whether any of the commands are still running."""
+        return any(not future.done() for future in self._futures or ())
+
+    @property
+    def succeeded(self) -> bool:
+        """Check whether every command has run and exited with status 0."""
+        return all(status == 0 for status in self.get_return().values())
+
+    def start(self) -> None:
+        """Start running the commands."""
+        from concurrent.futures import ThreadPoolExecutor
+
+        self.items = [
+            item for item in self.items if item.status not in ("queued", "running")
+        ]
+        self._futures = []
+        if not self.items:
+            return
+        for item in self.items:
+            item.status = "queued"
+        executor = ThreadPoolExecutor(max_workers=self.max_workers)
+        self._futures = [executor.submit(item.run_quietly) for item in self.items]
+        executor.shutdown(wait=False)
+
+    def poll(self) -> bool:
+        """
+        Check whether the commands have all finished.
+
+        :return: True the first time it's called after they have, straight away if \
+        there weren't any to run
+        """
+        if self._futures is None or self.running:
+            return False
+        self._futures = None
+        return True
+
+    def get_return(self) -> dict[CommandItem, int | None]:
+        """
+        Get the results of the commands.
+
+        :return: The exit status of each item, or None if it's still running or it \
+        couldn't be run
+        """
+        return {item: item.exit_status for item in self.items}
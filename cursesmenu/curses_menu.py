@@ -3,35 +3,87 @@
 from __future__ import annotations
 
 import atexit
+import contextlib
 import curses
+import functools
+import math
 import os
 import pathlib
 import shutil
+import sys
 import threading
 import time
-from collections import defaultdict
+from collections import defaultdict, deque
 from typing import TYPE_CHECKING, Any, cast
 
 import cursesmenu.utils
-from cursesmenu.item_group import ItemGroup
+from cursesmenu.input_multiplexer import InputMultiplexer
+from cursesmenu.item_group import ChainedItemGroups, ItemGroup, VirtualItemGroup
+from cursesmenu.search import FuzzyFilter, ItemFilter
 
 if TYPE_CHECKING:
+    import subprocess
+
     # noinspection PyCompatibility,PyProtectedMember
     from _curses import window
+    from collections.abc import Iterable, Iterator, Sequence
+    from concurrent.futures import ThreadPoolExecutor
     from typing import Callable
 
     Window = window
+    from cursesmenu.batch import BatchRunner
+    from cursesmenu.items.function_item import FunctionItem
     from cursesmenu.items.menu_item import MenuItem
+    from cursesmenu.navigator import MenuNavigator
+    from cursesmenu.output_pane import OutputPane
 else:
     Window = Any
     MenuItem = Any
 
 MIN_SIZE = 6  # Top bar, space, title, space, subtitle, space, bottom bar
+# Extra rows drawn above and below the visible window when only drawing the viewport
+VIEWPORT_OVERSCAN = 2
+# Height of a bounded pad, in multiples of the terminal height
+PAD_SCREENS = 3
+# Filters over at least this many items are scored, or build their index, on a
+# worker thread
+FILTER_BACKGROUND_ITEMS = 10000
+# How often to check for background search results while waiting for input, in ms
+FILTER_POLL_INTERVAL = 50
+# The most queued keys that are handled before the menu is drawn
+MAX_INPUT_BATCH = 256
+# How often items running in the background are checked on and redrawn, in ms
+BACKGROUND_POLL_INTERVAL = 100
+# The most index labels that are remembered between draws
+INDEX_TEXT_CACHE_SIZE = 4096
+# How often a menu that changes are posted to checks for them, in ms, where the
+# wait for a key can't be woken up
+POST_POLL_INTERVAL = 100
+# The most selections that from_iterable adds to the menu at once
+LOADING_CHUNK_SIZE = 500
+# How often a menu that from_iterable is loading adds the selections read so far, in ms
+LOADING_INTERVAL = 100
+
+_ESCAPE = 27
+_BACKSPACES = (curses.KEY_BACKSPACE, 127, ord("\b"))
 
 PROJECT_ROOT = pathlib.Path(__file__).parent.parent.absolute()
 _SCREENDUMP_DIR = PROJECT_ROOT.joinpath("screendumps")
 
 
+def _stdin_fd() -> int | None:
+    """Get the file descriptor of stdin, which curses reads from, if it can be watched."""
+    if sys.platform.startswith("win"):  # pragma: no-cover-nonwindows
+        # select can only wait for sockets on Windows
+        return None
+    else:  # pragma: no-cover-windows
+        try:
+            return sys.stdin.fileno()
+        except (AttributeError, ValueError):
+            # It was replaced with something that isn't a file, e.g. by pytest
+            return None
+
+
 class CursesMenu:
     """
     A menu created with the curses library.
@@ -46,6 +98,24 @@ class CursesMenu:
     :ivar items: The list of items for the menu
     :param show_exit_item: Whether the exit item is shown
     :param zero_pad: Zero pad the item indices to match the width of the biggest one
+    :param viewport_rendering: Only draw the items that fit on the screen, \
+    instead of every item in the menu. Useful for menus with a very large number \
+    of items
+    :param bounded_pad: Limit the height of the curses pad to a few screens \
+    instead of the height of the whole menu, redrawing it as the menu scrolls. \
+    Keeps curses memory use constant for very large menus. Implies viewport_rendering
+    :param fuzzy: Filter the items by fuzzy matching, ranking the best matches \
+    first, instead of by substring. Large menus are scored on a worker thread \
+    so the menu stays responsive
+    :param jump_timeout: How long in seconds to wait for the next key of a \
+    multi-key item index before starting a new one
+    :param max_fps: If set, changes to the items don't redraw the menu straight \
+    away. Instead :meth:`schedule_draw` is used, and the menu is redrawn on its own \
+    thread at most this many times a second however many changes there are
+    :param multi_select: Let the user mark command items with the space key. If any \
+    are marked, selecting runs all of them at once in the background, and the \
+    menu's returned_value is their exit statuses when they've all finished
+    :param max_batch_workers: The most marked commands to run at once
     :ivar current_option: The index of the currently highlighted menu item
     :ivar selected_option: The index of the last item the user selected, initially -1
     :ivar should_exit: Flag to signal that the menu should exit on \
@@ -55,18 +125,35 @@ class CursesMenu:
     :ivar user_input_handlers: A dictionary mapping character values to functions \
     that handle those characters
     :ivar current_item: The MenuItem that's currently highlighted
+    :ivar item_filter: The filter on the items that the user is typing, \
+    or None if all items are shown
+    :ivar marked_items: The items that the user has marked with multi_select
+    :ivar loaded_count: The number of selections that have been added so far while \
+    :meth:`from_iterable` is still loading them, or None otherwise
+    :ivar loading_error: The exception that stopped :meth:`from_iterable` from \
+    loading the rest of the selections, or None
+    :ivar navigator: The :class:`~cursesmenu.navigator.MenuNavigator` that's \
+    running this menu on a single thread along with its submenus, if there is one
+    :ivar last_input_flushes: The number of times the terminal was updated while \
+    handling the last input
     :ivar selected_item: The Menu item that's currently selected
     :cvar stdscr: The root curses window
+    :cvar flush_count: The number of times any menu has updated the terminal
     :ivar menu_height: The total height of the menu including the exit item
     :ivar last_item_index: The index of the max item in the menu, \
     including the exit item
     :cvar currently_active_menu: Class variable that holds the \
     currently active menu or None if no menu\
     is currently active (E.G. when switching between menus)
+    :cvar input_multiplexer: Class variable that holds the \
+    :class:`~cursesmenu.input_multiplexer.InputMultiplexer` that every menu gets \
+    its input from
     """
 
     currently_active_menu: CursesMenu | None = None
     stdscr: Window | None = None
+    flush_count = 0
+    input_multiplexer = InputMultiplexer()
 
     def __init__(
         self,
@@ -75,14 +162,38 @@ class CursesMenu:
         *,
         show_exit_item: bool = True,
         zero_pad: bool = False,
+        viewport_rendering: bool = False,
+        bounded_pad: bool = False,
+        fuzzy: bool = False,
+        jump_timeout: float = 1.0,
+        max_fps: float | None = None,
+        multi_select: bool = False,
+        max_batch_workers: int = 4,
         _debug_screens: bool = False,
     ) -> None:
         """Initialize the menu."""
         self.title = title
         self.subtitle = subtitle
         self.zero_pad = zero_pad
+        self.viewport_rendering = viewport_rendering or bounded_pad
+        self.bounded_pad = bounded_pad
+        self.fuzzy = fuzzy
+        self.jump_timeout = jump_timeout
+        self.max_fps = max_fps
+        self.multi_select = multi_select
+        self.max_batch_workers = max_batch_workers
 
         self.screen: Window | None = None
+        # The row of the menu that's at the top of the pad
+        self._pad_top = 0
+        # The thread that's handling a batch of input, if any. Its drawing waits until
+        # the end of the batch so it's only done once
+        self._batch_thread: int | None = None
+        self._draw_deferred = False
+        # Whether schedule_draw has been called since the last frame, and when that was
+        self._draw_scheduled = False
+        self._last_frame = -math.inf
+        self.last_input_flushes = 0
 
         # highlight should be initialized to black-on-white, but bold is a fine
         # fallback that doesn't need the screen initialized first
@@ -92,33 +203,72 @@ class CursesMenu:
         # TODO: add a way to replace item indices with letters
         self.items: ItemGroup = ItemGroup(self)
         self.end_items: ItemGroup = ItemGroup(self)
+        self.item_filter: ItemFilter | None = None
+        self._filter_executor: ThreadPoolExecutor | None = None
+        self.marked_items: set[MenuItem] = set()
+        self.loaded_count: int | None = None
+        self.loading_error: Exception | None = None
+        # Items that from_iterable has read but not added yet
+        self._loading_buffer: list[MenuItem] = []
+        self._loading_lock = threading.Lock()
+        self.navigator: MenuNavigator | None = None
+        # Selected items whose functions are still running in the background
+        self._background_items: list[FunctionItem | BatchRunner] = []
+        # Changes posted from other threads, and whether there have been any
+        self._posted: deque[Callable[[], object]] = deque()
+        self._gets_posts = False
         if show_exit_item:
             from cursesmenu.items.exit_item import ExitItem
 
             self.end_items.append(ExitItem(menu=self, override_index="q"))
+        self._all_items = ChainedItemGroups(self, self.items, self.end_items)
 
         self.current_option = 0
         self.selected_option = -1
 
+        # The keys typed so far for go_to, and when the last one was typed
+        self._jump_buffer = ""
+        self._jump_time = 0.0
+        # Maps override indices to positions in all_items, along with what it was
+        # built from so it can be rebuilt when that changes
+        self._jump_labels: dict[str, int] = {}
+        self._jump_labels_key: tuple[Any, ...] = ()
+
+        # The index labels that have been drawn, which change when the number of
+        # digits they're zero padded to does
+        self._index_texts: dict[int, str] = {}
+        self._index_count = 0
+        self._index_width = 0
+
         self._main_thread = threading.Thread(target=self._wrap_start, daemon=True)
 
         self._running = threading.Event()
+        # Set while the menu isn't on the screen, for joining a submenu opened by a
+        # navigator, which doesn't have a thread of its own
+        self._closed = threading.Event()
+        self._closed.set()
         self.should_exit = False
 
         # TODO: Should this be a property
-        self.returned_value = None
+        self.returned_value: Any = None
 
         self.parent: CursesMenu | None = None
 
+        # Keys without a handler might be part of an item's index
         self.user_input_handlers: defaultdict[int, Callable[[int], None]] = defaultdict(
-            cursesmenu.utils.null_input_factory,
+            lambda: self.go_to,
         )
         self.user_input_handlers.update(
             {
                 ord("\n"): self.select,
                 curses.KEY_UP: self.go_up,
                 curses.KEY_DOWN: self.go_down,
+                curses.KEY_PPAGE: self.go_page_up,
+                curses.KEY_NPAGE: self.go_page_down,
+                curses.KEY_HOME: self.go_to_first,
+                curses.KEY_END: self.go_to_last,
                 ord("q"): self.go_to_exit,
+                ord("/"): self.start_filter,
                 curses.KEY_RESIZE: self.on_resize,
             },
         )
@@ -133,19 +283,40 @@ class CursesMenu:
                 },
             )
         self.user_input_handlers.update(
-            {k: self.go_to for k in map(ord, map(str, range(1, 10)))},
+            {k: self.go_to for k in map(ord, map(str, range(10)))},
         )
+        if multi_select:
+            self.user_input_handlers[ord(" ")] = self.toggle_mark
+        # Handlers that only change what's shown, so queued input for them can be
+        # handled all at once
+        self._batched_handlers = {
+            self.go_up,
+            self.go_down,
+            self.go_page_up,
+            self.go_page_down,
+            self.go_to_first,
+            self.go_to_last,
+            self.go_to,
+            self.go_to_exit,
+            self.start_filter,
+            self.on_resize,
+            self.toggle_mark,
+        }
 
         self._debug_screens = _debug_screens
 
     @classmethod
     def make_selection_menu(
         cls,
-        selections: list[str],
+        selections: Sequence[str],
         title: str = "",
         subtitle: str = "",
         *,
         show_exit_item: bool = False,
+        viewport_rendering: bool = False,
+        bounded_pad: bool = False,
+        lazy: bool = False,
+        fuzzy: bool = False,
     ) -> CursesMenu:
         """
         Create a menu from a list of strings.
@@ -157,23 +328,52 @@ class CursesMenu:
         :param subtitle: The subtitle of the menu
         :param show_exit_item: If the exit item should be shown.\
         If it is  and the user selects it, the return value will be None
+        :param viewport_rendering: Only draw the selections that fit on the screen
+        :param bounded_pad: Limit the size of the curses pad to a few screens
+        :param lazy: Only create items for the selections as they're shown, \
+        using a :class:`~cursesmenu.item_group.VirtualItemGroup`. \
+        Implies viewport_rendering and bounded_pad
+        :param fuzzy: Filter the selections by fuzzy matching
         :return: A CursesMenu with items for each selection
         """
-        menu = cls(title=title, subtitle=subtitle, show_exit_item=show_exit_item)
+        menu = cls(
+            title=title,
+            subtitle=subtitle,
+            show_exit_item=show_exit_item,
+            viewport_rendering=viewport_rendering,
+            bounded_pad=bounded_pad or lazy,
+            fuzzy=fuzzy,
+        )
         from cursesmenu.items.selection_item import SelectionItem
 
-        for index, selection in enumerate(selections):
-            menu.items.append(
-                SelectionItem(text=selection, index=index, should_exit=True),
+        if lazy:
+            menu.items = VirtualItemGroup(
+                menu,
+                selections,
+                lambda index, selection: SelectionItem(
+                    text=selection,
+                    index=index,
+                    should_exit=True,
+                ),
+            )
+        else:
+            menu.items.extend(
+                SelectionItem(text=selection, index=index, should_exit=True)
+                for index, selection in enumerate(selections)
             )
         return menu
 
     @classmethod
     def get_selection(
         cls,
-        selections: list[str],
+        selections: Sequence[str],
         title: str = "",
         subtitle: str = "",
+        *,
+        viewport_rendering: bool = False,
+        bounded_pad: bool = False,
+        lazy: bool = False,
+        fuzzy: bool = False,
     ) -> int:
         """
         Present the user with a menu built from a list of strings and get the index\
@@ -182,6 +382,10 @@ class CursesMenu:
         :param selections: The list of string possibilities
         :param title: The title of the menu
         :param subtitle: The subtitle of the menu
+        :param viewport_rendering: Only draw the selections that fit on the screen
+        :param bounded_pad: Limit the size of the curses pad to a few screens
+        :param lazy: Only create items for the selections as they're shown
+        :param fuzzy: Filter the selections by fuzzy matching, best match first
         :return: The index in the list of strings that the user selected
         """
         menu = cls.make_selection_menu(
@@ -189,13 +393,118 @@ class CursesMenu:
             title=title,
             subtitle=subtitle,
             show_exit_item=False,
+            viewport_rendering=viewport_rendering,
+            bounded_pad=bounded_pad,
+            lazy=lazy,
+            fuzzy=fuzzy,
         )
         return cast(int, menu.show())
 
+    @classmethod
+    def from_iterable(
+        cls,
+        selections: Iterable[str],
+        title: str = "",
+        subtitle: str = "",
+        *,
+        show_exit_item: bool = False,
+        viewport_rendering: bool = True,
+        bounded_pad: bool = False,
+        fuzzy: bool = False,
+        chunk_size: int = LOADING_CHUNK_SIZE,
+    ) -> CursesMenu:
+        """
+        Create a menu from strings that take a while to produce, e.g. a generator.
+
+        The menu can be shown straight away. The selections are read on a background
+        thread, and added to the menu a chunk at a time, as soon as there's a full
+        chunk or every so often otherwise, while the subtitle shows how many there
+        are so far. If reading them raises an exception, the subtitle shows that
+        instead, and it's kept in loading_error. Like :meth:`make_selection_menu`,
+        the return value of the menu will be an index into the selections.
+
+        :param selections: The strings to be selected from
+        :param title: The title of the menu
+        :param subtitle: The subtitle of the menu
+        :param show_exit_item: If the exit item should be shown.\
+        If it is  and the user selects it, the return value will be None
+        :param viewport_rendering: Only draw the selections that fit on the screen. \
+        On by default, so that adding a chunk doesn't redraw every selection so far
+        :param bounded_pad: Limit the size of the curses pad to a few screens
+        :param fuzzy: Filter the selections by fuzzy matching
+        :param chunk_size: The most selections to add at once
+        :return: A CursesMenu that fills up with items for the selections
+        """
+        menu = cls(
+            title=title,
+            subtitle=subtitle,
+            show_exit_item=show_exit_item,
+            viewport_rendering=viewport_rendering,
+            bounded_pad=bounded_pad,
+            fuzzy=fuzzy,
+        )
+        menu.loaded_count = 0
+        threading.Thread(
+            target=cls._load_selections,
+            args=(menu, selections, chunk_size),
+            daemon=True,
+        ).start()
+        return menu
+
+    def _load_selections(self, selections: Iterable[str], chunk_size: int) -> None:
+        from cursesmenu.items.selection_item import SelectionItem
+
+        error = None
+        try:
+            for index, selection in enumerate(selections):
+                if self.should_exit:
+                    break
+                item = SelectionItem(text=selection, index=index, should_exit=True)
+                with self._loading_lock:
+                    self._loading_buffer.append(item)
+                    # Only once, if the menu hasn't got round to adding them yet
+                    full = len(self._loading_buffer) == chunk_size
+                if full:
+                    self.post(self._add_loaded)
+        except Exception as exception:  # noqa: BLE001
+            # Shown in the subtitle rather than ending the thread with a traceback
+            error = exception
+        self.post(functools.partial(self._finish_loading, error))
+
+    def _add_loaded(self) -> None:
+        """Add the selections that have been read so far to the items."""
+        with self._loading_lock:
+            chunk = self._loading_buffer
+            self._loading_buffer = []
+        if chunk:
+            assert self.loaded_count is not None
+            self.items.extend(chunk)
+            self.loaded_count += len(chunk)
+
+    def _finish_loading(self, error: Exception | None) -> None:
+        self._add_loaded()
+        self.loaded_count = None
+        self.loading_error = error
+        if self.screen is not None:
+            # The subtitle changed length
+            self.screen.erase()
+
     @property
-    def all_items(self) -> ItemGroup:
-        """Get the combined list of items."""
-        return self.items + self.end_items
+    def all_items(self) -> ChainedItemGroups:
+        """
+        Get the combined list of items.
+
+        This is a view over items and end_items rather than a copy, so it's cheap to
+        get and stays up to date as either group changes. It used to be a new
+        :class:`~cursesmenu.ItemGroup` each time, and it still compares and adds like
+        one, but it can't be changed. If the items are being filtered, only the items
+        that match the filter are included.
+        """
+        items = self.items if self.item_filter is None else self.item_filter
+        shown_items, end_items = self._all_items.groups
+        if shown_items is not items or end_items is not self.end_items:
+            self._all_items = ChainedItemGroups(self, items, self.end_items)
+        return self._all_items
 
     @property
     def current_item(self) -> MenuItem | None:
@@ -237,66 +546,119 @@ class CursesMenu:
         """
         Start the menu's thread and return without blocking.
 
-        The menu's thread is a daemon, so if the calling script \
-        may exit before the user is finished interacting, use \
+        The menu is run by a :class:`~cursesmenu.navigator.MenuNavigator`, so its
+        submenus are shown on the same thread. The menu's thread is a daemon, so if
+        the calling script may exit before the user is finished interacting, use
         :meth:`join()<cursesmenu.CursesMenu.join>` to block until the menu exits.
         """
         self.should_exit = False
         self._main_thread = threading.Thread(target=self._wrap_start, daemon=True)
         self._main_thread.start()
 
+    async def show_async(self) -> Any:  # noqa: ANN401
+        """
+        Show the menu on the running event loop until it exits.
+
+        Unlike :meth:`show`, no threads are started, for the menu or its submenus.
+        Input is read when the event loop sees that stdin is readable, and the
+        functions of :class:`~cursesmenu.items.FunctionItem` items can be
+        coroutines, which run on the event loop while the menu is still used.
+
+        :return: The return value from the last selected item
+        """
+        from cursesmenu.navigator import MenuNavigator
+
+        self.should_exit = False
+        navigator = MenuNavigator(self, blocking=False)
+        if self.parent is None:
+            with self._curses_session():
+                await navigator.run_async()
+        else:
+            await navigator.run_async()
+        return self.returned_value
+
     def _wrap_start(self) -> None:
+        from cursesmenu.navigator import MenuNavigator
+
+        # Submenus are opened on this thread too, rather than starting their own
+        navigator = MenuNavigator(self)
         if self.parent is None:
-            cursesmenu.utils.soft_clear_terminal()
-
-            # We only want to fully clear the screen at the exit of the outermost\
-            # Script that uses curses to prevent character handling from messing up
-            if os.getenv("CURSES_MENU_PID") is None:
-                pid = os.getpid()
-                os.environ["CURSES_MENU_PID"] = str(pid)
-                atexit.register(cursesmenu.utils.clear_terminal)
-
-            try:
-                CursesMenu.stdscr = curses.initscr()
-                curses.noecho()
-                curses.cbreak()
-                CursesMenu.stdscr.keypad(True)  # noqa: FBT003
-                # noinspection PyBroadException
-                try:  # noqa: SIM105
-                    curses.start_color()
-                except:  # noqa: E722,S110 # pragma: no cover all
-                    pass
-                self._main_loop()
-            finally:
-                # I currently don't remember whether there's a situation where stdscr
-                # should be None at runtime, so I'm leaving this as an if
-                # as opposed to an assert, but using a pragma for coverage
-                if CursesMenu.stdscr is not None:  # pragma: no branch
-                    CursesMenu.stdscr.keypad(False)  # noqa: FBT003
-                curses.endwin()
-                curses.echo()
-                curses.nocbreak()
-                if (
-                    shutil.which("[") is not None and shutil.which("stty") is not None
-                ):  # pragma: no cover all
-                    os.system("[ -t 0 ] && stty echo")
+            with self._curses_session():
+                navigator.run()
         else:
-            self._main_loop()
+            navigator.run()
+
+    @contextlib.contextmanager
+    def _curses_session(self) -> Iterator[None]:
+        """Initialize curses for the outermost menu, and restore the terminal after."""
+        cursesmenu.utils.soft_clear_terminal()
+
+        # We only want to fully clear the screen at the exit of the outermost\
+        # Script that uses curses to prevent character handling from messing up
+        if os.getenv("CURSES_MENU_PID") is None:
+            pid = os.getpid()
+            os.environ["CURSES_MENU_PID"] = str(pid)
+            atexit.register(cursesmenu.utils.clear_terminal)
+
+        try:
+            CursesMenu.stdscr = curses.initscr()
+            CursesMenu.input_multiplexer.window_timeout = -1
+            CursesMenu.input_multiplexer.watch(_stdin_fd())
+            curses.noecho()
+            curses.cbreak()
+            CursesMenu.stdscr.keypad(True)  # noqa: FBT003
+            # noinspection PyBroadException
+            try:  # noqa: SIM105
+                curses.start_color()
+            except:  # noqa: E722,S110 # pragma: no cover all
+                pass
+            yield
+        finally:
+            # I currently don't remember whether there's a situation where stdscr
+            # should be None at runtime, so I'm leaving this as an if
+            # as opposed to an assert, but using a pragma for coverage
+            if CursesMenu.stdscr is not None:  # pragma: no branch
+                CursesMenu.stdscr.keypad(False)  # noqa: FBT003
+            CursesMenu.input_multiplexer.watch(None)
+            curses.endwin()
+            curses.echo()
+            curses.nocbreak()
+            if (
+                shutil.which("[") is not None and shutil.which("stty") is not None
+            ):  # pragma: no cover all
+                os.system("[ -t 0 ] && stty echo")
+
+    def open_screen(self) -> None:
+        """
+        Create the menu's pad and draw the menu, ready for input.
 
-    def _main_loop(self) -> None:
+        Called when the menu starts. After that the menu is driven by calling
+        :meth:`process_user_input` until should_exit is set, then
+        :meth:`close_screen` is called.
+        """
         assert CursesMenu.stdscr is not None
-        self.screen = curses.newpad(self.menu_height, CursesMenu.stdscr.getmaxyx()[1])
+        self._closed.clear()
+        screen_rows, screen_cols = CursesMenu.stdscr.getmaxyx()
+        self.screen = curses.newpad(self._get_pad_rows(screen_rows), screen_cols)
         self._set_up_colors()
         curses.curs_set(0)
-        CursesMenu.stdscr.refresh()
+        # Flushed to the terminal along with the menu
+        CursesMenu.stdscr.noutrefresh()
+        self._draw_scheduled = False
         self.draw()
-
         self._running.set()
-        while self._running.wait() is not False and not self.should_exit:
-            CursesMenu.currently_active_menu = self
-            self.process_user_input()
+
+    def close_screen(self) -> None:
+        """Clear the menu off the screen after it exits."""
+        if self._filter_executor is not None:
+            self._filter_executor.shutdown(wait=False, cancel_futures=True)
+            self._filter_executor = None
         self.clear_screen()
+        if self.parent is None:
+            # Otherwise the parent will draw over it
+            self._update_terminal()
         self._running.clear()
+        self._closed.set()
 
     def _set_up_colors(self) -> None:
         curses.init_pair(1, curses.COLOR_BLACK, curses.COLOR_WHITE)
@@ -307,14 +669,27 @@ class CursesMenu:
         Draw the menu.
 
         Adds border, title and subtitle, and items, then refreshes the screen.
+        While a batch of input is being handled, waits until the end of the batch.
         """
+        if self._batch_thread == threading.get_ident():
+            self._draw_deferred = True
+            return
         assert self.screen is not None
-        self.screen.border()
-        self.screen.addstr(2, 2, self.title, curses.A_STANDOUT)
-        self.screen.addstr(4, 2, self.subtitle, curses.A_BOLD)
+        if self.bounded_pad:
+            assert CursesMenu.stdscr is not None
+            self._position_pad(CursesMenu.stdscr.getmaxyx()[0])
+            self._draw_bounded_border()
+        else:
+            self.screen.border()
+        self._draw_titles()
 
-        for index, item in enumerate(self.all_items):
-            self.draw_item(index, item)
+        if self.viewport_rendering:
+            all_items = self.all_items
+            for index in self.visible_item_range():
+                self.draw_item(index, all_items[index])
+        else:
+            for index, item in enumerate(self.all_items):
+                self.draw_item(index, item)
 
         self.refresh_screen()
         if self._debug_screens:  # pragma: no cover all
@@ -327,6 +702,42 @@ class CursesMenu:
             ).open("wb") as f:
                 self.screen.putwin(f)
 
+    def _draw_titles(self) -> None:
+        """Draw the title, and the subtitle or the filter, if they're in the pad."""
+        assert self.screen is not None
+        if self._pad_top <= 2:
+            self.screen.addstr(2 - self._pad_top, 2, self.title, curses.A_STANDOUT)
+        if self._pad_top <= 4:
+            if self.item_filter is None:
+                subtitle = self.subtitle
+                if self.loaded_count is not None:
+                    subtitle = f"{subtitle} (loading {self.loaded_count}...)".lstrip()
+                elif self.loading_error is not None:
+                    error = type(self.loading_error).__name__
+                    subtitle = f"{subtitle} (failed: {error})".lstrip()
+            elif self.item_filter.pending:
+                subtitle = f"/{self.item_filter.query} ..."
+            else:
+                subtitle = f"/{self.item_filter.query}"
+            self.screen.addstr(4 - self._pad_top, 2, subtitle, curses.A_BOLD)
+
+    def _get_index_text(self, index: int) -> str:
+        count = len(self.items) if self.zero_pad else 0
+        if count != self._index_count:
+            self._index_count = count
+            width = len(str(count)) if count else 0
+            if width != self._index_width:
+                self._index_width = width
+                self._index_texts.clear()
+
+        index_text = self._index_texts.get(index)
+        if index_text is None:
+            if len(self._index_texts) >= INDEX_TEXT_CACHE_SIZE:
+                self._index_texts.clear()
+            index_text = str(index + 1).zfill(self._index_width)
+            self._index_texts[index] = index_text
+        return index_text
+
     def draw_item(
         self,
         index: int,
@@ -341,54 +752,308 @@ class CursesMenu:
         :param index_text: Text to override the index portion of the item
         """
         if index_text is None:
-            index_text = str(index + 1)
-            if self.zero_pad:
-                pad_width = len(str(len(self.items)))
-                index_text = index_text.zfill(pad_width)
+            index_text = self._get_index_text(index)
 
         text_style = self.highlight if self.current_option == index else self.normal
         assert self.screen is not None
         assert text_style is not None
 
+        row = MIN_SIZE - 1 + index - self._pad_top
+        if self.bounded_pad and not 0 <= row < self.screen.getmaxyx()[0]:
+            return
+
+        if self.multi_select:
+            self.screen.addstr(row, 2, "*" if item in self.marked_items else " ")
         self.screen.addstr(
-            MIN_SIZE - 1 + index,
+            row,
             4,
             item.show(index_text),
             text_style,
         )
 
+    def _get_pad_rows(self, screen_rows: int) -> int:
+        if self.bounded_pad:
+            return min(self.menu_height, PAD_SCREENS * screen_rows)
+        else:
+            return self.menu_height
+
+    def _position_pad(self, screen_rows: int) -> bool:
+        """
+        Make sure that a bounded pad holds the part of the menu that's on screen.
+
+        If it doesn't, the pad is resized and moved so that the screen is in the
+        middle of it, and then erased.
+
+        :return: True if the pad was moved and needs to be drawn again
+        """
+        assert self.screen is not None
+        pad_rows, pad_cols = self.screen.getmaxyx()
+        wanted_rows = self._get_pad_rows(screen_rows)
+        top_row = self._get_top_row(screen_rows)
+        bottom_row = top_row + min(screen_rows, self.menu_height)
+        if (
+            pad_rows == wanted_rows
+            and self._pad_top <= top_row
+            and bottom_row <= self._pad_top + pad_rows
+        ):
+            return False
+
+        if pad_rows != wanted_rows:
+            self._resize_pad(wanted_rows, pad_cols)
+        self._pad_top = max(
+            0,
+            min(top_row - screen_rows, self.menu_height - wanted_rows),
+        )
+        self.screen.erase()
+        return True
+
+    def _resize_pad(self, rows: int, cols: int) -> None:
+        assert self.screen is not None
+        if rows < self.screen.getmaxyx()[0]:
+            # The screen below a shorter pad would keep showing the old menu
+            assert CursesMenu.stdscr is not None
+            CursesMenu.stdscr.erase()
+            CursesMenu.stdscr.noutrefresh()
+        else:
+            # Otherwise the old bottom border would be left between the items
+            self.screen.erase()
+        self.screen.resize(rows, cols)
+
+    def _draw_bounded_border(self) -> None:
+        """Draw the part of the border that's in a bounded pad."""
+        assert self.screen is not None
+        at_top = self._pad_top == 0
+        at_bottom = self._pad_top + self.screen.getmaxyx()[0] >= self.menu_height
+        # 0 draws the default border character
+        top = 0 if at_top else ord(" ")
+        top_corner = 0 if at_top else curses.ACS_VLINE
+        bottom = 0 if at_bottom else ord(" ")
+        bottom_corner = 0 if at_bottom else curses.ACS_VLINE
+        self.screen.border(
+            0,
+            0,
+            top,
+            bottom,
+            top_corner,
+            top_corner,
+            bottom_corner,
+            bottom_corner,
+        )
+
+    def visible_item_range(self) -> range:
+        """
+        Get the indices of the items that are on screen.
+
+        Includes a few items of overscan above and below the screen.
+
+        :return: A range of indices into all_items
+        """
+        assert CursesMenu.stdscr is not None
+        screen_rows = CursesMenu.stdscr.getmaxyx()[0]
+        first = self._get_top_row(screen_rows) - (MIN_SIZE - 1) - VIEWPORT_OVERSCAN
+        last = first + screen_rows + 2 * VIEWPORT_OVERSCAN
+        return range(max(first, 0), min(last, len(self.all_items)))
+
+    def _get_top_row(self, screen_rows: int) -> int:
+        if self.menu_height > screen_rows:
+            return min(self.menu_height - screen_rows, self.current_option)
+        else:
+            return 0
+
     def refresh_screen(self) -> None:
-        """Refresh what's onscreen to match the cursor's position."""
+        """
+        Refresh what's onscreen to match the cursor's position.
+
+        Anything else that's been staged, e.g. by :meth:`clear_screen`, is written to
+        the terminal at the same time.
+        """
+        self._stage_screen()
+        self._update_terminal()
+
+    def _stage_screen(self) -> None:
+        """Copy the visible part of the pad to curses' copy of the screen."""
         assert CursesMenu.stdscr is not None
         assert self.screen is not None
         screen_rows, screen_cols = CursesMenu.stdscr.getmaxyx()
+        top_row = self._get_top_row(screen_rows) - self._pad_top
 
-        if self.menu_height > screen_rows:
-            top_row = min(self.menu_height - screen_rows, self.current_option)
-        else:
-            top_row = 0
+        self.screen.noutrefresh(top_row, 0, 0, 0, screen_rows - 1, screen_cols - 1)
 
-        self.screen.refresh(top_row, 0, 0, 0, screen_rows - 1, screen_cols - 1)
+    @staticmethod
+    def _update_terminal() -> None:
+        """Write curses' copy of the screen to the terminal."""
+        curses.doupdate()
+        CursesMenu.flush_count += 1
 
     def process_user_input(self) -> int:
         """
         Get and then handle the user's input.
 
+        If the input only moves the cursor or changes the filter, any more input like
+        that which is already waiting, e.g. from a held down key or a paste, is
+        handled too, and the menu is drawn once at the end. Otherwise the menu would
+        fall further and further behind the keyboard.
+
         :return: The character the user input.
         """
+        item_filter = self.item_filter
         user_input = self.get_input()
-        self.user_input_handlers[user_input](user_input)
+        flushes = CursesMenu.flush_count
+        if item_filter is not None and item_filter.poll():
+            self._filter_changed()
+        self._poll_background_items()
+        self._apply_posted()
+        if self.loaded_count is not None:
+            self._add_loaded()
+        # -1 means that nothing was typed before getch timed out
+        if user_input != -1:
+            self._handle_input_batch(user_input)
+        self._draw_if_scheduled()
+        self.last_input_flushes = CursesMenu.flush_count - flushes
         return user_input
 
-    # noinspection PyMethodMayBeStatic
+    def _poll_background_items(self) -> None:
+        """Deliver the results of background work that finished, and redraw it."""
+        if not self._background_items:
+            return
+        for item in list(self._background_items):
+            if item.poll():
+                self._background_items.remove(item)
+                self.returned_value = item.get_return()
+                if item.should_exit:
+                    self.should_exit = True
+                # Its label got shorter, so the spinner has to be erased
+                assert self.screen is not None
+                self.screen.erase()
+        # Animates the spinners of the ones that are still running
+        self.schedule_draw()
+
+    def post(self, function: Callable[[], object]) -> None:
+        """
+        Make a change to the menu on its own thread.
+
+        Can be called from any thread. The functions that have been posted are called
+        in order the next time the menu checks for input, all at once, and then the
+        menu is redrawn once, or as part of the next frame if it has a max_fps. The
+        wait for a key is cut short, so that the change is shown straight away. Where
+        that can't be done, e.g. on Windows, a menu that's had anything posted to it
+        checks for more every so often while it's waiting for input instead.
+
+        :param function: A function that changes the menu, e.g. its items
+        """
+        self._posted.append(function)
+        self._gets_posts = True
+        CursesMenu.input_multiplexer.wake()
+
+    def _apply_posted(self) -> None:
+        if not self._posted:
+            return
+        version = self.items.version
+        with self.items.batch():
+            # Only the ones posted so far, so a busy producer can't hold up the input
+            for _ in range(len(self._posted)):
+                self._posted.popleft()()
+        if self.items.version == version:
+            # The group didn't redraw the menu, but the items might have changed
+            self.schedule_draw()
+
+    def _handle_input_batch(self, user_input: int) -> None:
+        if not self._can_batch(user_input):
+            self._handle_input(user_input)
+            return
+
+        start_option = self.current_option
+        self._batch_thread = threading.get_ident()
+        try:
+            self._handle_input(user_input)
+            self._handle_pending_input()
+        finally:
+            self._batch_thread = None
+        if self._draw_deferred:
+            self._draw_deferred = False
+            self.draw()
+        elif self.current_option != start_option:
+            # Only draw the net movement
+            option = self.current_option
+            self.current_option = start_option
+            self._move_to(option)
+
+    def _handle_pending_input(self) -> None:
+        """Handle the input that's waiting, until there's some that can't be batched."""
+        assert CursesMenu.stdscr is not None
+        for _ in range(MAX_INPUT_BATCH - 1):
+            user_input = CursesMenu.input_multiplexer.read_key(CursesMenu.stdscr, 0)
+            if user_input == -1:
+                break
+            if not self._can_batch(user_input):
+                curses.ungetch(user_input)
+                break
+            self._handle_input(user_input)
+
+    def _can_batch(self, user_input: int) -> bool:
+        if self.item_filter is not None and self._is_filter_input(user_input):
+            return True
+        return self.user_input_handlers[user_input] in self._batched_handlers
+
+    def _handle_input(self, user_input: int) -> None:
+        if self.item_filter is not None and self._is_filter_input(user_input):
+            self._handle_filter_input(user_input)
+        else:
+            self.user_input_handlers[user_input](user_input)
+
+    @staticmethod
+    def _is_filter_input(user_input: int) -> bool:
+        if user_input in _BACKSPACES or user_input == _ESCAPE:
+            return True
+        return 32 <= user_input < 127
+
+    def _handle_filter_input(self, user_input: int) -> None:
+        """Add a typed character to the filter, or remove one."""
+        assert self.item_filter is not None
+        query = self.item_filter.query
+        if user_input in _BACKSPACES:
+            self.filter_items(query[:-1] if query else None)
+        elif user_input == _ESCAPE:
+            self.filter_items(None)
+        else:
+            self.filter_items(query + chr(user_input))
+
     def get_input(self) -> int:
         """
         Get the user's input.
 
-        :return: The character input by the user.
+        While a search or an item is running in the background, or selections are
+        being loaded, only waits a short time so that the results can be shown as soon
+        as they're ready. Likewise, if the menu has a max_fps, waits at most until the
+        next frame. Changes posted from other threads cut the wait short.
+
+        :return: The character input by the user, or -1 if there wasn't any.
         """
-        assert CursesMenu.stdscr is not None
-        return CursesMenu.stdscr.getch()
+        delay = self.input_delay
+        if self.navigator is not None and not self.navigator.blocking:
+            # The navigator only asks for input once it's there
+            delay = 0
+        return CursesMenu.input_multiplexer.get_input(self, delay)
+
+    @property
+    def input_delay(self) -> int:
+        """
+        Get how long to wait for input before the menu has to be updated.
+
+        :return: The time in ms, or -1 to wait for as long as it takes
+        """
+        delays = []
+        if self.item_filter is not None and self.item_filter.pending:
+            delays.append(FILTER_POLL_INTERVAL)
+        if self._background_items:
+            delays.append(BACKGROUND_POLL_INTERVAL)
+        if self._gets_posts and not CursesMenu.input_multiplexer.can_wake:
+            delays.append(POST_POLL_INTERVAL)
+        if self.loaded_count is not None:
+            delays.append(LOADING_INTERVAL)
+        if self.max_fps is not None:
+            delays.append(self._get_frame_delay())
+        return min(delays, default=-1)
 
     def _exit(self) -> None:
         self.should_exit = True
@@ -402,41 +1067,194 @@ class CursesMenu:
         """
         Select the current item.
 
-        Called for the enter/return key.
+        Called for the enter/return key. If the item starts running in the
+        background, its return value is delivered when it finishes.
         """
+        from cursesmenu.items.function_item import FunctionItem
+        from cursesmenu.items.submenu_item import SubmenuItem
+
         if not self.all_items:
             self._exit()
             return
+        if self.marked_items:
+            self.run_marked_items()
+            return
         self.selected_option = self.current_option
 
-        assert self.selected_item is not None
-        self.selected_item.set_up()
-        self.selected_item.action()
-        self.selected_item.clean_up()
+        item = self.selected_item
+        assert item is not None
+        if self.navigator is not None and isinstance(item, SubmenuItem):
+            # Its return value is delivered when the navigator closes it
+            item.set_up()
+            self.navigator.push(item)
+            return
+        item.set_up()
+        item.action()
+        item.clean_up()
+
+        if isinstance(item, FunctionItem) and item.running:
+            if item not in self._background_items:
+                self._background_items.append(item)
+            assert self.screen is not None
+            self.screen.erase()
+            self.draw()
+            return
 
-        self.returned_value = self.selected_item.get_return()
-        self.should_exit = self.selected_item.should_exit
+        self.returned_value = item.get_return()
+        self.should_exit = item.should_exit
 
         if not self.should_exit:
             self.draw()
 
+    def toggle_mark(self, _: int = 0) -> None:
+        """
+        Mark the current item to be run with the others, or unmark it.
+
+        Called for the space key if the menu has multi_select. Only command items can
+        be marked.
+        """
+        from cursesmenu.items.command_item import CommandItem
+
+        item = self.current_item
+        if not isinstance(item, CommandItem):
+            return
+        if item in self.marked_items:
+            self.marked_items.remove(item)
+        else:
+            self.marked_items.add(item)
+        self.draw()
+
+    def run_marked_items(self) -> None:
+        """Run the marked items in the background and unmark them."""
+        from cursesmenu.batch import BatchRunner
+        from cursesmenu.items.command_item import CommandItem
+
+        # All of them, including the ones that a filter is hiding
+        runner = BatchRunner(
+            (
+                item
+                for item in ChainedItemGroups(self, self.items, self.end_items)
+                if item in self.marked_items and isinstance(item, CommandItem)
+            ),
+            self.max_batch_workers,
+        )
+        self.marked_items.clear()
+        runner.start()
+        self._background_items.append(runner)
+        assert self.screen is not None
+        # Their status labels might be shorter than the last ones
+        self.screen.erase()
+        self.draw()
+
     def go_to(self, user_input: int) -> None:
         """
-        Go to a given numbered item.
+        Go to the item with a given index.
 
-        Called on numerical input. Currently implementation only works on single digits.
+        Called on numerical input, and for any other key without a handler so that
+        items with an override_index can be jumped to as well. Keys typed within
+        jump_timeout seconds of each other are put together, so typing 1 then 2 goes
+        to item 1 and then item 12. If a key doesn't continue an index, a new one is
+        started with it.
         """
-        if self.last_item_index > 9:
-            go_to_max = ord("9")
-        elif self.last_item_index < 0:
+        if not 32 < user_input < 127:
             return
+        key = chr(user_input)
+        now = time.monotonic()
+        if now - self._jump_time > self.jump_timeout:
+            self._jump_buffer = ""
+        self._jump_time = now
+
+        option = self._find_jump(self._jump_buffer + key)
+        if option is None:
+            self._jump_buffer = key
+            option = self._find_jump(key)
         else:
-            go_to_max = ord(str(self.last_item_index))
-        # TODO: Make this use a buffer for multi-digit numbers
-        # TODO: also use for letters
-        if ord("1") <= user_input <= go_to_max:
-            self.current_option = user_input - ord("0") - 1
-            self.draw()
+            self._jump_buffer += key
+        if option is not None:
+            self._move_to(option)
+
+    def _find_jump(self, index_text: str) -> int | None:
+        """
+        Find the item whose index is shown as the given text.
+
+        Numbers map straight to positions, and override indices are looked up in a
+        map that's only rebuilt when the items or the filter change.
+
+        :return: The item's position in all_items, or None if there isn't one
+        """
+        all_items = self.all_items
+        if index_text.isdigit() and 0 < int(index_text) <= len(all_items):
+            option = int(index_text) - 1
+            if all_items[option].override_index is None:
+                return option
+
+        item_filter = self.item_filter
+        key = (
+            self.items,
+            self.items.version,
+            self.end_items,
+            self.end_items.version,
+            item_filter,
+            None if item_filter is None else item_filter.query,
+        )
+        if key != self._jump_labels_key:
+            self._jump_labels = {
+                item.override_index: position
+                for position, item in enumerate(all_items)
+                if item.override_index is not None
+            }
+            self._jump_labels_key = key
+        return self._jump_labels.get(index_text)
+
+    def start_filter(self, _: int = 0) -> None:
+        """
+        Start filtering the items by what the user types.
+
+        Called for /. While filtering, typed characters are added to the filter and
+        backspace removes them. Removing every character or pressing escape stops
+        filtering. The exit item is always shown.
+        """
+        self.filter_items("")
+
+    def filter_items(self, query: str | None) -> None:
+        """
+        Only show the items whose text contains the query, ignoring case.
+
+        If the menu is fuzzy, the items that contain the query's characters in order
+        are shown instead, best match first.
+
+        :param query: The text to search for, or None to show every item again
+        """
+        if query is None:
+            if self.item_filter is not None:
+                self.item_filter.cancel()
+            self.item_filter = None
+        elif self.item_filter is None:
+            self.item_filter = self._make_filter(query)
+        else:
+            self.item_filter.query = query
+        self._filter_changed()
+
+    def _make_filter(self, query: str) -> ItemFilter:
+        filter_class = FuzzyFilter if self.fuzzy else ItemFilter
+        if len(self.items) < FILTER_BACKGROUND_ITEMS:
+            return filter_class(self.items, query)
+        if self._filter_executor is None:
+            from concurrent.futures import ThreadPoolExecutor
+
+            self._filter_executor = ThreadPoolExecutor(
+                max_workers=1,
+                thread_name_prefix="cursesmenu-filter",
+            )
+        return filter_class(self.items, query, self._filter_executor)
+
+    def _filter_changed(self) -> None:
+        self.current_option = 0
+        # The matches can change without the query, e.g. when a search finishes
+        self._jump_labels_key = ()
+        if self.screen is not None:
+            self.screen.erase()
+            self.adjust_screen_size()
 
     def go_to_exit(self, _: int = 0) -> None:
         """
@@ -444,8 +1262,7 @@ class CursesMenu:
 
         Called for Q.
         """
-        self.current_option = self.last_item_index
-        self.draw()
+        self._move_to(self.last_item_index)
 
     def go_down(self, _: int = 0) -> None:
         """
@@ -454,10 +1271,9 @@ class CursesMenu:
         Called when the user presses the down arrow.
         """
         if self.current_option < self.last_item_index:
-            self.current_option += 1
+            self._move_to(self.current_option + 1)
         else:
-            self.current_option = 0
-        self.draw()
+            self._move_to(0)
 
     def go_up(self, _: int = 0) -> None:
         """
@@ -466,10 +1282,80 @@ class CursesMenu:
         Called when the user presses the up arrow.
         """
         if self.current_option > 0:
-            self.current_option += -1
+            self._move_to(self.current_option - 1)
         else:
-            self.current_option = self.last_item_index
-        self.draw()
+            self._move_to(self.last_item_index)
+
+    def go_page_down(self, _: int = 0) -> None:
+        """
+        Go down one screen of items, stopping at the last one.
+
+        Called when the user presses page down.
+        """
+        self._move_to(
+            min(self.current_option + self._page_size(), self.last_item_index),
+        )
+
+    def go_page_up(self, _: int = 0) -> None:
+        """
+        Go up one screen of items, stopping at the first one.
+
+        Called when the user presses page up.
+        """
+        self._move_to(max(self.current_option - self._page_size(), 0))
+
+    def go_to_first(self, _: int = 0) -> None:
+        """
+        Go to the first item.
+
+        Called when the user presses home.
+        """
+        self._move_to(0)
+
+    def go_to_last(self, _: int = 0) -> None:
+        """
+        Go to the last item.
+
+        Called when the user presses end.
+        """
+        self._move_to(self.last_item_index)
+
+    def _page_size(self) -> int:
+        """Get the number of items that fit on the screen below the highlighted one."""
+        assert CursesMenu.stdscr is not None
+        return max(1, CursesMenu.stdscr.getmaxyx()[0] - MIN_SIZE)
+
+    def _move_to(self, option: int) -> None:
+        """
+        Move the cursor to the given item.
+
+        Only the previously and newly highlighted rows are redrawn. Scrolling is
+        handled by refreshing a different part of the pad, except when only the
+        viewport is drawn, in which case the rows that scrolled into view are also
+        drawn.
+        """
+        if not 0 <= option < len(self.all_items):
+            return
+        if self._batch_thread == threading.get_ident():
+            self.current_option = option
+            return
+        assert CursesMenu.stdscr is not None
+        screen_rows = CursesMenu.stdscr.getmaxyx()[0]
+        old_top_row = self._get_top_row(screen_rows)
+
+        dirty_rows = {self.current_option, option}
+        self.current_option = option
+        if self.bounded_pad and self._position_pad(screen_rows):
+            self.draw()
+            return
+        if self.viewport_rendering and self._get_top_row(screen_rows) != old_top_row:
+            dirty_rows.update(self.visible_item_range())
+
+        all_items = self.all_items
+        for index in sorted(dirty_rows):
+            if 0 <= index < len(all_items):
+                self.draw_item(index, all_items[index])
+        self.refresh_screen()
 
     def on_resize(self, _: int = 0) -> None:
         """Handle a terminal resize event."""
@@ -479,19 +1365,48 @@ class CursesMenu:
         self.draw()
 
     def clear_screen(self) -> None:
-        """Clear the screen for this menu."""
+        """
+        Clear the screen for this menu.
+
+        The terminal is only updated the next time something is drawn, so that
+        switching to another menu is a single update.
+        """
         assert self.screen is not None
         self.screen.clear()
-        self.refresh_screen()
+        self._stage_screen()
+
+    def show_output(self, pane: OutputPane, process: subprocess.Popen[str]) -> int:
+        """
+        Show the output of a process in a pane over the menu until it's closed.
+
+        :param pane: The pane to show the output in
+        :param process: The process, with its output piped to stdout
+        :return: The exit status of the process
+        """
+        assert CursesMenu.stdscr is not None
+        assert self.screen is not None
+        try:
+            return pane.run(CursesMenu.stdscr, process)
+        finally:
+            CursesMenu.stdscr.erase()
+            CursesMenu.stdscr.noutrefresh()
+            # So the next draw covers all of the pane
+            self.screen.erase()
 
     def join(self, timeout: int | None = None) -> Any:  # noqa: ANN401
         """
         Block until the menu exits.
 
+        A submenu opened by a :class:`~cursesmenu.navigator.MenuNavigator` is waited
+        on until the navigator closes it.
+
         :param timeout: time in seconds until the menu is forced to close
         :return: The value returned from the last selected item
         """
-        self._main_thread.join(timeout=timeout)
+        if self.navigator is not None and self.navigator.root is not self:
+            self._closed.wait(timeout)
+        elif self._main_thread.ident is not None:
+            self._main_thread.join(timeout=timeout)
         return self.returned_value
 
     def is_running(self) -> bool:
@@ -523,9 +1438,12 @@ class CursesMenu:
         """
         Check if the menu's thread is running.
 
+        A submenu opened by a :class:`~cursesmenu.navigator.MenuNavigator` runs on
+        its parent's thread, so it's alive until it's closed.
+
         :return: True if the menu's thread is alive, false if not.
         """
-        return self._main_thread.is_alive()
+        return self.navigator is not None or self._main_thread.is_alive()
 
     def exit(self, timeout: int | None = None) -> Any:  # noqa: ANN401
         """
@@ -538,13 +1456,56 @@ class CursesMenu:
         return self.join(timeout)
 
     def adjust_screen_size(self) -> None:
-        """Adjust the screen size to match the length of the item list and redraw."""
-        if self.screen:
-            max_row, max_cols = self.screen.getmaxyx()
-            if max_row < MIN_SIZE + len(self.all_items):
-                self.screen.resize(self.menu_height, max_cols)
+        """
+        Adjust the screen size to match the length of the item list and redraw.
+
+        If the menu has a max_fps, this is left until the next frame.
+        """
+        if self.max_fps is not None:
+            self.schedule_draw()
+        elif self.screen:
+            self._fit_pad()
             self.draw()
 
+    def _fit_pad(self) -> None:
+        assert self.screen is not None
+        max_row, max_cols = self.screen.getmaxyx()
+        if not self.bounded_pad and max_row != self.menu_height:
+            self._resize_pad(self.menu_height, max_cols)
+
+    def schedule_draw(self) -> None:
+        """
+        Redraw the menu on its own thread, as part of the next frame.
+
+        Can be called from any thread, as often as needed. Several calls between
+        frames only draw the menu once. If the menu doesn't have a max_fps, it's
+        drawn the next time it checks for input instead. The wait for a key is cut
+        short for it, like for :meth:`post`, except where that can't be done.
+        """
+        if not self._draw_scheduled:
+            self._draw_scheduled = True
+            CursesMenu.input_multiplexer.wake()
+
+    def _get_frame_delay(self) -> int:
+        """Get how long to wait for input before drawing the next frame, in ms."""
+        assert self.max_fps is not None
+        interval = 1 / self.max_fps
+        if self._draw_scheduled:
+            interval += self._last_frame - time.monotonic()
+        return round(max(0.0, interval) * 1000)
+
+    def _draw_if_scheduled(self) -> None:
+        if not self._draw_scheduled or self.screen is None:
+            return
+        now = time.monotonic()
+        if self.max_fps is not None and now - self._last_frame < 1 / self.max_fps:
+            return
+        # Cleared before drawing so that a change made meanwhile schedules another
+        self._draw_scheduled = False
+        self._last_frame = now
+        self._fit_pad()
+        self.draw()
+
     def __repr__(self) -> str:
         """Get a string representation of the menu."""
         return f"<{self.title}: {self.subtitle}. {len(self.items)} items>"
@@ -0,0 +1,194 @@
+"""Reading the user's input for the menu that's active."""
+
+from __future__ import annotations
+
+import contextlib
+import curses
+import os
+import select
+import threading
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    # noinspection PyCompatibility,PyProtectedMember
+    from _curses import window
+
+    from cursesmenu.curses_menu import CursesMenu
+
+
+class InputMultiplexer:
+    """
+    Reads the keys from the terminal, and gives each one to the active menu.
+
+    Every menu gets its input from here, whichever thread it runs on. The menus that
+    aren't active wait until they are, without using any CPU, and only one thread
+    reads from the terminal at a time. If a key is read by the thread of a menu that
+    stopped being active while it was waiting, e.g. a parent that was paused for a
+    submenu, it's put back for the active menu to read.
+
+    By default, a menu waits for a key for as long as it takes, unless it has to
+    update sooner, e.g. to animate an item running in the background. A timeout can
+    be set as well, so that menus wake up regularly, and so that a key can't be held
+    up by a menu that stopped being active.
+
+    Once the file descriptor that curses reads from is being watched, the wait for a
+    key can also be cut short from another thread with :meth:`wake`, e.g. to show a
+    change that it made.
+
+    :param timeout: The longest time to wait for a key, in ms, or -1 for no limit
+    """
+
+    def __init__(self, timeout: int = -1) -> None:
+        """Initialize the multiplexer."""
+        self.timeout = timeout
+        # The input timeout that the window is set to, -1 for blocking
+        self.window_timeout = -1
+        # The file descriptor that curses reads the keys from, if it's watched
+        self.input_fd: int | None = None
+        # Both ends of a pipe that's written to to wake up the wait for a key
+        self._wakeup: tuple[int, int] | None = None
+        self._active = threading.Condition()
+        self._reading = threading.Lock()
+
+    def halfdelay(self, tenths: int) -> None:
+        """
+        Wait at most a number of tenths of a second for a key, like curses.halfdelay.
+
+        :param tenths: The longest time to wait
+        """
+        self.timeout = tenths * 100
+
+    @property
+    def can_wake(self) -> bool:
+        """Check whether :meth:`wake` can cut short a wait for a key."""
+        return self.input_fd is not None
+
+    @property
+    def wakeup_fd(self) -> int | None:
+        """Get a file descriptor that's readable after :meth:`wake`, if there is one."""
+        return None if self._wakeup is None else self._wakeup[0]
+
+    def watch(self, input_fd: int | None) -> None:
+        """
+        Wait for keys with select, so that the wait can be cut short by :meth:`wake`.
+
+        :param input_fd: The file descriptor that curses reads from, usually stdin's, \
+        or None to go back to waiting in getch
+        """
+        if input_fd is not None and self._wakeup is None:
+            self._wakeup = os.pipe()
+            for end in self._wakeup:
+                os.set_blocking(end, False)
+        self.input_fd = input_fd
+
+    def wake(self) -> None:
+        """
+        Stop waiting for a key, if it's being waited for, or don't wait for the next.
+
+        Can be called from any thread.
+        """
+        if self._wakeup is not None:
+            # If the pipe is full, there's already a wakeup waiting to be read
+            with contextlib.suppress(BlockingIOError):
+                os.write(self._wakeup[1], b"\0")
+
+    def _clear_wakeups(self) -> bool:
+        """
+        Read every wakeup that's waiting.
+
+        :return: True if there were any
+        """
+        if self._wakeup is None:
+            return False
+        woken = False
+        with contextlib.suppress(BlockingIOError):
+            while os.read(self._wakeup[0], 4096):
+                woken = True
+        return woken
+
+    def activate(self, menu: CursesMenu | None) -> None:
+        """
+        Make a menu the one that gets the input.
+
+        :param menu: The menu, or None if no menu is active, e.g. between menus
+        """
+        from cursesmenu.curses_menu import CursesMenu
+
+        with self._active:
+            CursesMenu.currently_active_menu = menu
+            self._active.notify_all()
+
+    def read_key(self, screen: window, delay: int) -> int:
+        """
+        Read a key from a window, whichever menu is active.
+
+        For reading more keys for the menu that's already handling one, or for
+        something that's shown over the menus, like an output pane.
+
+        :param screen: The window to read from
+        :param delay: How long to wait, in ms, or -1 for as long as it takes
+        :return: The key, or -1 if there wasn't one
+        """
+        with self._reading:
+            return self._read_key(screen, delay)
+
+    def _read_key(self, screen: window, delay: int) -> int:
+        woken = self._clear_wakeups()
+        if self.input_fd is None or delay == 0 or woken:
+            self.set_window_timeout(screen, 0 if woken else delay)
+            return screen.getch()
+
+        # A key that curses already has, e.g. one that was put back, isn't on the fd
+        self.set_window_timeout(screen, 0)
+        user_input = screen.getch()
+        if user_input != -1:
+            return user_input
+        assert self._wakeup is not None
+        readable, _, _ = select.select(
+            [self.input_fd, self._wakeup[0]],
+            [],
+            [],
+            None if delay < 0 else delay / 1000,
+        )
+        self._clear_wakeups()
+        if self.input_fd not in readable:
+            return -1
+        return screen.getch()
+
+    def set_window_timeout(self, screen: window, delay: int) -> None:
+        """
+        Set how long getch waits for a key, unless it's already set to that.
+
+        :param screen: The window that's read from
+        :param delay: The time in ms, or -1 to wait for as long as it takes
+        """
+        if self.window_timeout != delay:
+            self.window_timeout = delay
+            screen.timeout(delay)
+
+    def get_input(self, menu: CursesMenu, delay: int) -> int:
+        """
+        Get a key for a menu, once it's the active one.
+
+        :param menu: The menu that wants the input
+        :param delay: How long the menu can wait, in ms, or -1 for as long as it takes
+        :return: The key, or -1 if there wasn't one for the menu
+        """
+        from cursesmenu.curses_menu import CursesMenu
+
+        with self._active:
+            self._active.wait_for(
+                lambda: CursesMenu.currently_active_menu in (None, menu),
+            )
+        if self.timeout >= 0 and (delay < 0 or self.timeout < delay):
+            delay = self.timeout
+        with self._reading:
+            assert CursesMenu.stdscr is not None
+            user_input = self._read_key(CursesMenu.stdscr, delay)
+            if user_input != -1 and CursesMenu.currently_active_menu not in (
+                None,
+                menu,
+            ):
+                curses.ungetch(user_input)
+                return -1
+        return user_input
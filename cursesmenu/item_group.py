@@ -2,11 +2,16 @@
 
 from __future__ import annotations
 
-from collections.abc import Iterable, MutableSequence
+import contextlib
+import functools
+import itertools
+from collections import OrderedDict
+from collections.abc import Iterable, MutableSequence, Sequence
 from typing import TYPE_CHECKING, Any, cast, overload
 
 if TYPE_CHECKING:
     from collections.abc import Iterator
+    from typing import Callable
 
     from cursesmenu.curses_menu import CursesMenu
     from cursesmenu.items.menu_item import MenuItem
@@ -21,6 +26,16 @@ class ItemGroup(MutableSequence[MenuItem]):
 
     Holds the items and ensures that the menu updates when a new one is added.
     Implements MutableSequence, so should act like a list.
+
+    Every change resizes and redraws the menu. To make many changes at once, use
+    :meth:`batch`, :meth:`extend` or :meth:`replace_all` so the menu is only updated
+    once.
+
+    Changes are made on the menu's own thread. From other threads, use
+    :meth:`append_threadsafe` or :meth:`extend_threadsafe`, or
+    :meth:`~cursesmenu.CursesMenu.post`, so that they're made there.
+
+    :ivar version: A counter that goes up every time the group is changed
     """
 
     def __init__(
@@ -33,15 +48,62 @@ class ItemGroup(MutableSequence[MenuItem]):
             items = []
         self.items: list[MenuItem] = list(items)
         self.menu = menu
+        self.version = 0
+        self._batch_depth = 0
+        self._batch_changed = False
 
         for item in items:
             item.menu = self.menu
 
+    @contextlib.contextmanager
+    def batch(self) -> Iterator[None]:
+        """
+        Defer updating the menu until the end of a block of changes.
+
+        However many changes are made to the group inside the block, the menu is
+        resized and redrawn once, when the block exits. Batches can be nested.
+        """
+        self._batch_depth += 1
+        try:
+            yield
+        finally:
+            self._batch_depth -= 1
+            if self._batch_depth == 0 and self._batch_changed:
+                self._batch_changed = False
+                self.menu.adjust_screen_size()
+
+    def _changed(self) -> None:
+        self.version += 1
+        if self._batch_depth > 0:
+            self._batch_changed = True
+        else:
+            self.menu.adjust_screen_size()
+
     def insert(self, index: int, value: MenuItem) -> None:
         """Insert an item."""
         value.menu = self.menu
         self.items.insert(index, value)
-        self.menu.adjust_screen_size()
+        self._changed()
+
+    def extend(self, values: Iterable[MenuItem]) -> None:
+        """Add several items to the end of the group, updating the menu once."""
+        values = list(values)
+        for value in values:
+            value.menu = self.menu
+        self.items.extend(values)
+        self._changed()
+
+    def append_threadsafe(self, value: MenuItem) -> None:
+        """Add an item to the end of the group on the menu's thread."""
+        self.menu.post(functools.partial(self.append, value))
+
+    def extend_threadsafe(self, values: Iterable[MenuItem]) -> None:
+        """Add several items to the end of the group on the menu's thread."""
+        self.menu.post(functools.partial(self.extend, list(values)))
+
+    def replace_all(self, values: Iterable[MenuItem]) -> None:
+        """Replace every item in the group, updating the menu once."""
+        self[:] = values
 
     @overload
     def __getitem__(self, i: int) -> MenuItem: ...
@@ -72,14 +134,16 @@ class ItemGroup(MutableSequence[MenuItem]):
         if isinstance(i, int):
             item = cast(MenuItem, item)
             item.menu = self.menu
+            self._unmark([self.items[i]], [item])
             self.items[i] = item
         else:
-            item = cast(Iterable[MenuItem], item)
+            item = list(cast(Iterable[MenuItem], item))
             for it in item:
                 it.menu = self.menu
+            self._unmark(self.items[i], item)
             self.items[i] = item
 
-        self.menu.adjust_screen_size()
+        self._changed()
 
     @overload
     def __delitem__(self, i: int) -> None: ...
@@ -89,13 +153,28 @@ class ItemGroup(MutableSequence[MenuItem]):
 
     def __delitem__(self, i: int | slice) -> None:
         """Delete an item."""
+        removed = self.items[i]
+        self._unmark(removed if isinstance(removed, list) else [removed])
         del self.items[i]
-        self.menu.adjust_screen_size()
+        self._changed()
+
+    def _unmark(
+        self,
+        removed: Iterable[MenuItem],
+        kept: Iterable[MenuItem] = (),
+    ) -> None:
+        """Unmark the items that are taken out of the group, so they aren't run."""
+        if self.menu.marked_items:
+            self.menu.marked_items.difference_update(set(removed).difference(kept))
 
     def __iter__(self) -> Iterator[MenuItem]:
         """Get an iterator for the group."""
         return iter(self.items)
 
+    def texts(self) -> list[str]:
+        """Get the text of every item, e.g. to search them."""
+        return [item.text for item in self.items]
+
     def __len__(self) -> int:
         """Get the number of items in the group."""
         return len(self.items)
@@ -116,3 +195,177 @@ class ItemGroup(MutableSequence[MenuItem]):
         if len(self) != len(other):
             return False
         return all(item1 == item2 for item1, item2 in zip(self, other))
+
+
+class VirtualItemGroup(ItemGroup):
+    """
+    A read-only group of items that are created on demand.
+
+    Instead of holding an item for every row, the group holds a sequence of rows and
+    calls a factory to turn a row into an item when it's needed, e.g. when it's drawn
+    or selected. Only the most recently used items are kept, so memory use doesn't
+    grow with the number of rows. Use it with viewport rendering so that only the
+    rows on screen are ever turned into items.
+
+    The group can't be changed directly. Change the source and call :meth:`refresh`
+    instead.
+
+    :param menu: The menu that the items belong to
+    :param source: The rows to create items from
+    :param factory: Called with the index of a row and the row itself to create the \
+    row's item
+    :param cache_size: The number of created items to keep around
+    :param row_text: Gets the text that a row's item will have, without creating it
+    """
+
+    def __init__(
+        self,
+        menu: CursesMenu,
+        source: Sequence[Any],
+        factory: Callable[[int, Any], MenuItem],
+        cache_size: int = 1024,
+        row_text: Callable[[Any], str] = str,
+    ) -> None:
+        """Initialize the group."""
+        super().__init__(menu)
+        self.source = source
+        self.factory = factory
+        self.cache_size = cache_size
+        self.row_text = row_text
+        self._cache: OrderedDict[int, MenuItem] = OrderedDict()
+
+    def refresh(self) -> None:
+        """Forget the created items and update the menu after the source changes."""
+        self._cache.clear()
+        self._changed()
+
+    @overload
+    def __getitem__(self, i: int) -> MenuItem: ...
+
+    @overload
+    def __getitem__(self, i: slice) -> ItemGroup: ...
+
+    def __getitem__(self, i: int | slice) -> MenuItem | ItemGroup:
+        if isinstance(i, slice):
+            return ItemGroup(
+                self.menu,
+                [self[index] for index in range(*i.indices(len(self)))],
+            )
+        if i < 0:
+            i += len(self)
+        if not 0 <= i < len(self):
+            msg = "item index out of range"
+            raise IndexError(msg)
+
+        item = self._cache.get(i)
+        if item is None:
+            item = self.factory(i, self.source[i])
+            item.menu = self.menu
+            self._cache[i] = item
+            if len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+        else:
+            self._cache.move_to_end(i)
+        return item
+
+    def __setitem__(
+        self,
+        i: int | slice,
+        item: MenuItem | Iterable[MenuItem],
+    ) -> None:
+        self._read_only()
+
+    def __delitem__(self, i: int | slice) -> None:
+        self._read_only()
+
+    def insert(self, index: int, value: MenuItem) -> None:  # noqa: ARG002
+        """Raise a TypeError, the group is read-only."""
+        self._read_only()
+
+    def extend(self, values: Iterable[MenuItem]) -> None:  # noqa: ARG002
+        """Raise a TypeError, the group is read-only."""
+        self._read_only()
+
+    def _read_only(self) -> None:
+        msg = f"{type(self).__name__} is read-only, change its source instead"
+        raise TypeError(msg)
+
+    def __iter__(self) -> Iterator[MenuItem]:
+        """Get an iterator that creates each item in turn."""
+        return (self[index] for index in range(len(self)))
+
+    def __len__(self) -> int:
+        """Get the number of rows in the source."""
+        return len(self.source)
+
+    def texts(self) -> list[str]:
+        """Get the text of every row's item, without creating the items."""
+        return [self.row_text(row) for row in self.source]
+
+    def __add__(self, other: ItemGroup) -> ItemGroup:
+        """Add two groups together, creating every item in this one."""
+        return ItemGroup(self.menu, [*self, *other])
+
+
+class ChainedItemGroups(Sequence[MenuItem]):
+    """
+    A read-only view of several item groups as one sequence.
+
+    The groups aren't copied, so indexing and length are computed against the
+    groups' current contents and the view never goes stale when they change. Like an
+    :class:`ItemGroup`, the view can be compared with other sequences of items, and
+    added to another group to get a new one.
+
+    :param menu: The menu that the items belong to
+    :param groups: The item groups to chain together, in order
+    """
+
+    def __init__(self, menu: CursesMenu, *groups: Sequence[MenuItem]) -> None:
+        """Initialize the view."""
+        self.menu = menu
+        self.groups = groups
+
+    @overload
+    def __getitem__(self, i: int) -> MenuItem: ...
+
+    @overload
+    def __getitem__(self, i: slice) -> list[MenuItem]: ...
+
+    def __getitem__(self, i: int | slice) -> MenuItem | list[MenuItem]:
+        if isinstance(i, slice):
+            return [self[index] for index in range(*i.indices(len(self)))]
+        if i < 0:
+            i += len(self)
+        if i >= 0:
+            for group in self.groups:
+                if i < len(group):
+                    return group[i]
+                i -= len(group)
+        msg = "item index out of range"
+        raise IndexError(msg)
+
+    def __iter__(self) -> Iterator[MenuItem]:
+        """Get an iterator over every group in turn."""
+        return itertools.chain.from_iterable(self.groups)
+
+    def __len__(self) -> int:
+        """Get the total number of items in all the groups."""
+        return sum(len(group) for group in self.groups)
+
+    def __add__(self, other: Sequence[MenuItem]) -> ItemGroup:
+        """
+        Add the items to another group's.
+
+        The resulting group will have the menu of the view.
+        """
+        return ItemGroup(self.menu, [*self, *other])
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, (ItemGroup, ChainedItemGroups)):
+            if self.menu != other.menu:
+                return False
+        elif not isinstance(other, Sequence):
+            return NotImplemented
+        if len(self) != len(other):
+            return False
+        return all(item1 == item2 for item1, item2 in zip(self, other))
@@ -1,9 +1,15 @@
-from .command_item import CommandItem
-from .exit_item import ExitItem
-from .external_item import ExternalItem
-from .function_item import FunctionItem
-from .menu_item import MenuItem
-from .submenu_item import SubmenuItem
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .command_item import CommandItem  # noqa: TCH004
+    from .exit_item import ExitItem  # noqa: TCH004
+    from .external_item import ExternalItem  # noqa: TCH004
+    from .function_item import FunctionItem  # noqa: TCH004
+    from .menu_item import MenuItem  # noqa: TCH004
+    from .submenu_item import SubmenuItem  # noqa: TCH004
 
 __all__ = [
     "CommandItem",
@@ -13,3 +19,28 @@ __all__ = [
     "MenuItem",
     "ExitItem",
 ]
+
+# The module that each item is defined in. They're only imported when they're first
+# used, so that e.g. subprocess isn't imported by menus without command items
+_ITEM_MODULES = {
+    "CommandItem": "command_item",
+    "ExternalItem": "external_item",
+    "FunctionItem": "function_item",
+    "SubmenuItem": "submenu_item",
+    "MenuItem": "menu_item",
+    "ExitItem": "exit_item",
+}
+
+
+def __getattr__(name: str) -> Any:  # noqa: ANN401
+    if name not in _ITEM_MODULES:
+        msg = f"module {__name__!r} has no attribute {name!r}"
+        raise AttributeError(msg)
+    module = importlib.import_module(f".{_ITEM_MODULES[name]}", __name__)
+    item_class = getattr(module, name)
+    globals()[name] = item_class
+    return item_class
+
+
+def __dir__() -> list[str]:
+    return sorted([*globals(), *__all__])
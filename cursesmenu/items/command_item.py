@@ -2,36 +2,77 @@
 
 from __future__ import annotations
 
+import contextlib
+import shutil
 import subprocess
 import sys
 from pathlib import Path
 from typing import TYPE_CHECKING
 
+import cursesmenu.utils
 from cursesmenu.items.external_item import ExternalItem
+from cursesmenu.output_pane import OutputPane
 
 if TYPE_CHECKING:
     import os
-    from typing import Any
+    from typing import IO, Any
 
     from cursesmenu.curses_menu import CursesMenu
 
     PathType = os.PathLike[Any]
 
+# The width of the status shown next to an item that's run quietly
+_STATUS_WIDTH = 12
+
 
 class CommandItem(ExternalItem):
     """
     A  menu item that runs a shell command using subprocess.run.
 
+    Without a shell, the command is run directly with the arguments as its argv, so
+    they don't need quoting and starting it doesn't need a shell process as well. With
+    posix_spawn too, the command is looked up on the PATH first and the other file
+    descriptors are inherited, which lets subprocess start it with os.posix_spawn
+    instead of fork and exec.
+
+    With stream_output, the command's stdout and stderr are shown in a scrollable
+    :class:`~cursesmenu.output_pane.OutputPane` over the menu as it runs, instead of
+    leaving curses mode.
+
+    Several command items can also be run at the same time, in the background, with
+    :meth:`run_quietly`. That's what a menu with multi_select does with the items
+    that are marked. The item then shows a spinner while it runs, and its exit status
+    afterwards.
+
     :param text: The text for the menu item.
     :param command: The shell command to run when the item is selected.
     :param arguments: Additional arguments passed to the command.
     :param menu: The menu that this item belongs to
     :param should_exit: Whether the menu will exit when this item is selected
     :param stdout_filepath: A filepath that the stdout for the command will be written \
-    to
-    :param kwargs: A list of kwargs to be passed to subprocess.run
+    to. Ignored if the output is streamed
+    :param stream_output: Whether to show the output in a pane inside the menu
+    :param max_output_lines: The number of lines of streamed output to keep
+    :param shell: Whether to run the command and arguments as a line of the shell
+    :param posix_spawn: Whether to start the command with os.posix_spawn where \
+    possible. Only used without a shell
+    :param kwargs: A list of kwargs to be passed to subprocess.run, or to \
+    subprocess.Popen if the output is streamed
     """
 
+    __slots__ = (
+        "arguments",
+        "command",
+        "exit_status",
+        "kwargs",
+        "max_output_lines",
+        "posix_spawn",
+        "shell",
+        "status",
+        "stdout_filepath",
+        "stream_output",
+    )
+
     def __init__(
         self,
         text: str,
@@ -42,6 +83,10 @@ class CommandItem(ExternalItem):
         should_exit: bool = False,
         override_index: str | None = None,
         stdout_filepath: PathType | None = None,
+        stream_output: bool = False,
+        max_output_lines: int = 1000,
+        shell: bool = True,
+        posix_spawn: bool = False,
         **kwargs: Any,  # noqa: ANN401
     ) -> None:
         """Initialize the menu."""
@@ -64,37 +109,127 @@ class CommandItem(ExternalItem):
         else:
             self.stdout_filepath = None
 
+        self.stream_output = stream_output
+        self.max_output_lines = max_output_lines
+        self.shell = shell
+        self.posix_spawn = posix_spawn
+
         self.exit_status: int | None = None
+        # How the last quiet run of the command went, shown next to the item
+        self.status: str | None = None
 
     def _get_args_list(self) -> list[str]:
         args = [self.command, *self.arguments]
+        if not self.shell:
+            return args
         if not sys.platform.startswith("win"):  # pragma: no-cover-windows
             return [" ".join(args)]
         else:  # pragma: no-cover-nonwindows
             return args
 
+    def _get_run_kwargs(self) -> dict[str, Any]:
+        run_kwargs: dict[str, Any] = {"shell": self.shell}
+        if self.posix_spawn and not self.shell:
+            # subprocess only uses posix_spawn for a path to an executable, when no
+            # file descriptors have to be closed
+            run_kwargs["executable"] = shutil.which(self.command)
+            run_kwargs["close_fds"] = False
+        return {**run_kwargs, **self.kwargs}
+
+    @property
+    def running(self) -> bool:
+        """Check whether the command is being run quietly."""
+        return self.status == "running"
+
+    def set_up(self) -> None:
+        """Pause the menu, unless the output is streamed into it."""
+        if not self.stream_output:
+            super().set_up()
+
+    def clean_up(self) -> None:
+        """Resume the menu, unless the output is streamed into it."""
+        if not self.stream_output:
+            super().clean_up()
+
     def action(self) -> None:
-        """Run the command using subprocess.run."""
+        """Run the command using subprocess.run, or stream its output."""
         args = self._get_args_list()
 
+        if self.stream_output:
+            assert self.menu is not None
+            process = subprocess.Popen(
+                args,
+                stdin=subprocess.DEVNULL,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.STDOUT,
+                text=True,
+                errors="replace",
+                **self._get_run_kwargs(),
+            )
+            pane = OutputPane(self.text, self.max_output_lines)
+            with process:
+                self.exit_status = self.menu.show_output(pane, process)
+            return
+
         if self.stdout_filepath:
             with self.stdout_filepath.open("w") as stdout:
                 completed_process = subprocess.run(
                     args,
-                    shell=True,
                     stdout=stdout,
                     check=False,
-                    **self.kwargs,
+                    **self._get_run_kwargs(),
                 )
         else:
             completed_process = subprocess.run(
                 args,
-                shell=True,
                 check=False,
-                **self.kwargs,
+                **self._get_run_kwargs(),
             )
         self.exit_status = completed_process.returncode
 
+    def run_quietly(self) -> int:
+        """
+        Run the command with no input and without writing to the terminal.
+
+        Its stdout and stderr go to stdout_filepath if there is one, or are discarded
+        otherwise. Can be called from any thread.
+
+        :return: The exit status of the command
+        """
+        self.status = "running"
+        self.exit_status = None
+        try:
+            with contextlib.ExitStack() as stack:
+                stdout: IO[Any] | int = subprocess.DEVNULL
+                if self.stdout_filepath:
+                    stdout = stack.enter_context(self.stdout_filepath.open("w"))
+                completed_process = subprocess.run(
+                    self._get_args_list(),
+                    stdin=subprocess.DEVNULL,
+                    stdout=stdout,
+                    stderr=subprocess.STDOUT,
+                    check=False,
+                    **self._get_run_kwargs(),
+                )
+            self.exit_status = completed_process.returncode
+        finally:
+            if self.exit_status is None:
+                self.status = "failed"
+            else:
+                self.status = f"exit {self.exit_status}"
+        return self.exit_status
+
+    def show(self, index_text: str) -> str:
+        """Show the item, with its progress if it was run quietly."""
+        shown = super().show(index_text)
+        if self.status is None:
+            return shown
+        status = self.status
+        if status == "running":
+            status = f"running {cursesmenu.utils.spinner_frame()}"
+        # Padded so that a status covers up a longer one that was drawn before it
+        return f"{shown} ({status})".ljust(len(shown) + _STATUS_WIDTH)
+
     def get_return(self) -> int | None:
         """Get the exit status of the command or None if it hasn't been run."""
         return self.exit_status
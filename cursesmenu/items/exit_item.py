@@ -19,6 +19,8 @@ class ExitItem(MenuItem):
     :param menu: the menu for this item
     """
 
+    __slots__ = ("_parent_title",)
+
     def __init__(
         self,
         menu: CursesMenu | None = None,
@@ -32,6 +34,9 @@ class ExitItem(MenuItem):
             should_exit=True,
             override_index=override_index,
         )
+        # The title of the parent menu that the text was last set for, None for a
+        # root menu
+        self._parent_title: str | None = None
 
     def show(self, index_text: str) -> str:
         """
@@ -41,10 +46,14 @@ class ExitItem(MenuItem):
         :param index_text:
         :return: The representation of this item
         """
-        if self.menu and self.menu.parent:
-            # TODO: implement an item that exits the whole menu
-            #  hierarchy from a submenu.
-            self.text = f"Return to {self.menu.parent.title} menu"
-        else:
-            self.text = "Exit"
+        parent = self.menu.parent if self.menu else None
+        parent_title = parent.title if parent else None
+        if parent_title != self._parent_title:
+            self._parent_title = parent_title
+            if parent_title is None:
+                self.text = "Exit"
+            else:
+                # TODO: implement an item that exits the whole menu
+                #  hierarchy from a submenu.
+                self.text = f"Return to {parent_title} menu"
         return super().show(index_text)
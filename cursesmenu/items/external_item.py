@@ -10,6 +10,8 @@ class ExternalItem(MenuItem):
     """A base class for menu items that need to exit the menu environment\
      temporarily."""
 
+    __slots__ = ()
+
     def set_up(self) -> None:
         """Return the console to its original state and pause the menu."""
         assert self.menu is not None
@@ -2,11 +2,15 @@
 
 from __future__ import annotations
 
+import inspect
 from typing import TYPE_CHECKING
 
+import cursesmenu.utils
 from cursesmenu.items.external_item import ExternalItem
 
 if TYPE_CHECKING:
+    import asyncio
+    from concurrent.futures import Executor, Future
     from typing import Any, Callable
 
     from cursesmenu.curses_menu import CursesMenu
@@ -16,14 +20,42 @@ class FunctionItem(ExternalItem):
     """
     A menu item that executes a Python function with arguments.
 
+    Normally the menu leaves curses mode and waits while the function runs. In the
+    background, the function is run on an executor instead, so the menu can still be
+    used. A spinner is shown next to the item until the function finishes, then its
+    return value is delivered to the menu. If it raises an exception, that's kept in
+    :attr:`exception` and shown next to the item.
+
+    The function can be a coroutine function. In a menu shown with
+    :meth:`~cursesmenu.CursesMenu.show_async` it's always run in the background, as
+    a task on the event loop. Otherwise it's run to completion with asyncio.run.
+
     :param text: The text of the item
     :param function: A function or lambda to be executed when the item is selected
     :param args: A list of poitional arguments to be passed to the function
     :param kwargs: A dict of kwargs to be passed to the function
     :param menu: The menu that this item belongs to
-    :param should_exit: Whether the menu will exit when this item is selected
+    :param should_exit: Whether the menu will exit when this item is selected, or \
+    when the function finishes if it's run in the background
+    :param background: Whether to run the function in the background
+    :param executor: Where to run the function, which implies background. Use a \
+    ProcessPoolExecutor for functions that hold the GIL, except for coroutine \
+    functions, whose coroutines can't be sent to another process. By default each \
+    run of the function gets a thread of its own
+    :raises TypeError: If a coroutine function is given a ProcessPoolExecutor
     """
 
+    __slots__ = (
+        "args",
+        "background",
+        "exception",
+        "executor",
+        "function",
+        "future",
+        "kwargs",
+        "return_value",
+    )
+
     def __init__(
         self,
         text: str,
@@ -34,8 +66,16 @@ class FunctionItem(ExternalItem):
         *,
         should_exit: bool = False,
         override_index: str | None = None,
+        background: bool = False,
+        executor: Executor | None = None,
     ) -> None:
         """Initialize the item."""
+        if executor is not None and inspect.iscoroutinefunction(function):
+            from concurrent.futures import ProcessPoolExecutor
+
+            if isinstance(executor, ProcessPoolExecutor):
+                msg = "A coroutine can't be pickled, run it on a thread instead"
+                raise TypeError(msg)
         super().__init__(
             text=text,
             menu=menu,
@@ -52,9 +92,114 @@ class FunctionItem(ExternalItem):
 
         self.return_value: Any = None
 
+        self.background = background or executor is not None
+        self.executor = executor
+        # The function's result while it's running in the background
+        self.future: Future[Any] | asyncio.Future[Any] | None = None
+        self.exception: BaseException | None = None
+
+    @property
+    def running(self) -> bool:
+        """Check whether the function is running in the background."""
+        return self.future is not None
+
+    def _runs_as_task(self) -> bool:
+        if not inspect.iscoroutinefunction(self.function):
+            return False
+        # Only imported for coroutines, as it takes a while
+        import asyncio
+
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return False
+        return True
+
+    def _runs_in_background(self) -> bool:
+        return self.background or self._runs_as_task()
+
+    def set_up(self) -> None:
+        """Pause the menu, unless the function runs in the background."""
+        if not self._runs_in_background():
+            super().set_up()
+
+    def clean_up(self) -> None:
+        """Resume the menu, unless the function runs in the background."""
+        if not self._runs_in_background():
+            super().clean_up()
+
+    def _call(self) -> Any:  # noqa: ANN401
+        result = self.function(*self.args, **self.kwargs)
+        if inspect.iscoroutine(result):
+            import asyncio
+
+            result = asyncio.run(result)
+        return result
+
     def action(self) -> None:
-        """Call the function with the provided arguments."""
-        self.return_value = self.function(*self.args, **self.kwargs)
+        """
+        Call the function with the provided arguments.
+
+        In the background, the function is only started, and selecting the item again
+        does nothing until it finishes.
+        """
+        if not self._runs_in_background():
+            self.return_value = self._call()
+            return
+        if self.future is not None:
+            return
+        self.return_value = None
+        self.exception = None
+        if self._runs_as_task():
+            import asyncio
+
+            self.future = asyncio.ensure_future(
+                self.function(*self.args, **self.kwargs),
+            )
+            return
+        executor = self.executor
+        if executor is None:
+            from concurrent.futures import ThreadPoolExecutor
+
+            executor = ThreadPoolExecutor(max_workers=1)
+        if inspect.iscoroutinefunction(self.function):
+            import asyncio
+
+            coroutine = self.function(*self.args, **self.kwargs)
+            self.future = executor.submit(asyncio.run, coroutine)
+        else:
+            self.future = executor.submit(self.function, *self.args, **self.kwargs)
+        if executor is not self.executor:
+            # The item's own thread goes away once the function finishes
+            self.future.add_done_callback(lambda _: executor.shutdown(wait=False))
+
+    def poll(self) -> bool:
+        """
+        Collect the result of the function if it finished in the background.
+
+        If it was cancelled instead, it's finished without a return value.
+
+        :return: True if it finished since the last poll
+        """
+        future = self.future
+        if future is None or not future.done():
+            return False
+        self.future = None
+        if future.cancelled():
+            return True
+        self.exception = future.exception()
+        if self.exception is None:
+            self.return_value = future.result()
+        return True
+
+    def show(self, index_text: str) -> str:
+        """Show the item, with a spinner if it's running or the error if it failed."""
+        shown = super().show(index_text)
+        if self.future is not None:
+            return f"{shown} {cursesmenu.utils.spinner_frame()}"
+        if self.exception is not None:
+            return f"{shown} (failed: {type(self.exception).__name__})"
+        return shown
 
     def get_return(self) -> Any:  # noqa: ANN401
         """
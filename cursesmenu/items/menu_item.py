@@ -16,11 +16,18 @@ class MenuItem:
 
     Is displayed in a basic manner and does nothing when selected.
 
+    Items use __slots__ to keep them small, since a menu can hold a very large
+    number of them. Subclasses that don't declare __slots__ get a __dict__ as usual,
+    so they can set whatever attributes they like, but declaring __slots__ for any
+    new attributes keeps them just as compact.
+
     :param text: The text representing this menu item
     :param should_exit: Whether the menu should exit when this item is selected
     :param menu: The menu that owns this item
     """
 
+    __slots__ = ("menu", "override_index", "should_exit", "text")
+
     def __init__(
         self,
         text: str,
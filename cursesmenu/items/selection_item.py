@@ -15,6 +15,8 @@ else:
 class SelectionItem(MenuItem):
     """A class for a menu item with an integer return value."""
 
+    __slots__ = ("index",)
+
     def __init__(
         self,
         text: str,
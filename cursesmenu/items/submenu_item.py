@@ -16,12 +16,20 @@ class SubmenuItem(MenuItem):
     """
     A menu item that opens a submenu.
 
+    In a menu that's run by a :class:`~cursesmenu.navigator.MenuNavigator`, which is
+    how :meth:`~cursesmenu.CursesMenu.start` and
+    :meth:`~cursesmenu.CursesMenu.show_async` run it, the submenu is opened on the
+    same thread. Otherwise, :meth:`action` starts it on a thread of its own and
+    :meth:`clean_up` waits for that to finish.
+
     :param text: The text of the item
     :param submenu: A CursesMenu to be displayed when the item is selected
     :param menu: The menu that this item belongs to
     :param should_exit: Whether the menu will exit when this item is selected
     """
 
+    __slots__ = ("_menu", "_submenu")
+
     def __init__(
         self,
         text: str,
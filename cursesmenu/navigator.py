@@ -0,0 +1,131 @@
+"""Running a menu and its submenus on a single thread."""
+
+from __future__ import annotations
+
+import contextlib
+import sys
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from cursesmenu.curses_menu import CursesMenu
+    from cursesmenu.items.submenu_item import SubmenuItem
+
+
+class MenuNavigator:
+    """
+    Runs a menu, and the submenus opened from it, on a single thread.
+
+    The menus are kept in a stack, and only the one on top gets input. Selecting a
+    :class:`~cursesmenu.items.SubmenuItem` pushes its submenu instead of starting a
+    thread for it. When the submenu exits it's popped, and the item's return value is
+    given to the menu under it.
+
+    :param root: The menu at the bottom of the stack
+    :param blocking: Whether the menus wait for input themselves. If not, input is \
+    only asked for once it's there, as in :meth:`run_async`
+    """
+
+    def __init__(self, root: CursesMenu, *, blocking: bool = True) -> None:
+        """Initialize the navigator."""
+        self.root = root
+        self.blocking = blocking
+        # Each menu, and the item that opened it
+        self.stack: list[tuple[CursesMenu, SubmenuItem | None]] = []
+
+    @property
+    def active_menu(self) -> CursesMenu | None:
+        """Get the menu on top of the stack, or None once they've all exited."""
+        return self.stack[-1][0] if self.stack else None
+
+    def push(self, item: SubmenuItem) -> None:
+        """
+        Open the submenu of an item on top of the stack.
+
+        :param item: The selected item
+        """
+        submenu = item.submenu
+        assert submenu is not None
+        submenu.should_exit = False
+        self._open(submenu, item)
+
+    def run(self) -> None:
+        """
+        Run the menus until the one at the bottom exits.
+
+        While the menu on top is paused, this waits until it's resumed.
+        """
+        self._open(self.root, None)
+        while self.stack:
+            self.stack[-1][0].wait_for_start()
+            self.process_user_input()
+
+    async def run_async(self) -> None:
+        """Run the menus on the event loop until the one at the bottom exits."""
+        import asyncio
+
+        from cursesmenu.curses_menu import CursesMenu
+
+        loop = asyncio.get_running_loop()
+        readable = asyncio.Event()
+        stdin = sys.stdin.fileno()
+        # Woken up by changes that are posted from other threads too
+        wakeup = CursesMenu.input_multiplexer.wakeup_fd
+        self._open(self.root, None)
+        loop.add_reader(stdin, readable.set)
+        if wakeup is not None:
+            loop.add_reader(wakeup, readable.set)
+        try:
+            while self.stack:
+                delay = self.stack[-1][0].input_delay
+                with contextlib.suppress(asyncio.TimeoutError):
+                    await asyncio.wait_for(
+                        readable.wait(),
+                        None if delay < 0 else delay / 1000,
+                    )
+                readable.clear()
+                # curses may have already read more than one key from stdin
+                while self.stack and self.process_user_input() != -1:
+                    pass
+        finally:
+            loop.remove_reader(stdin)
+            if wakeup is not None:
+                loop.remove_reader(wakeup)
+
+    def process_user_input(self) -> int:
+        """
+        Give the menu on top of the stack its input, and close it if it exits.
+
+        :return: The character the user input
+        """
+        from cursesmenu.curses_menu import CursesMenu
+
+        menu = self.stack[-1][0]
+        CursesMenu.input_multiplexer.activate(menu)
+        user_input = menu.process_user_input()
+        while self.stack and self.stack[-1][0].should_exit:
+            self._close()
+        return user_input
+
+    def _open(self, menu: CursesMenu, item: SubmenuItem | None) -> None:
+        menu.navigator = self
+        self.stack.append((menu, item))
+        menu.open_screen()
+
+    def _close(self) -> None:
+        from cursesmenu.curses_menu import CursesMenu
+
+        menu, item = self.stack.pop()
+        menu.close_screen()
+        if CursesMenu.currently_active_menu is menu:
+            CursesMenu.input_multiplexer.activate(None)
+        menu.navigator = None
+        if item is None:
+            return
+
+        parent = item.menu
+        assert parent is not None
+        parent.resume()
+        parent.returned_value = item.get_return()
+        parent.should_exit = item.should_exit
+        if not parent.should_exit:
+            parent.draw()
@@ -0,0 +1,167 @@
+"""A pane that shows the output of a running command."""
+
+from __future__ import annotations
+
+import curses
+import itertools
+import threading
+from collections import deque
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import subprocess
+
+    # noinspection PyCompatibility,PyProtectedMember
+    from _curses import window
+    from collections.abc import Iterable
+
+# How often the pane checks for new output while waiting for input, in ms
+OUTPUT_POLL_INTERVAL = 100
+# How long a process that's stopped gets to exit before it's killed, in seconds
+STOP_TIMEOUT = 5
+# Border, title, status line, border
+_FRAME_ROWS = 4
+
+
+class OutputPane:
+    """
+    A scrollable view of the output of a command, drawn over the menu.
+
+    Only the last max_lines lines are kept, so a command that prints a lot can't use
+    up the memory. The pane follows the end of the output until it's scrolled up, and
+    goes back to following it with the end key.
+
+    :param title: The title shown at the top of the pane
+    :param max_lines: The number of lines of output to keep
+    """
+
+    def __init__(self, title: str, max_lines: int = 1000) -> None:
+        """Initialize the pane."""
+        self.title = title
+        self.lines: deque[str] = deque(maxlen=max_lines)
+        # The number of lines that have ever been added
+        self.line_count = 0
+        # The first line shown, or None to follow the end of the output
+        self.top: int | None = None
+        self._lock = threading.Lock()
+
+    def feed(self, stream: Iterable[str]) -> None:
+        """
+        Add lines to the pane until the stream ends.
+
+        Can be called from any thread.
+
+        :param stream: The lines to add
+        """
+        for line in stream:
+            shown = "".join(
+                char if char.isprintable() else "?"
+                for char in line.rstrip("\r\n").expandtabs()
+            )
+            with self._lock:
+                self.lines.append(shown)
+                self.line_count += 1
+
+    def scroll(self, delta: int, height: int) -> None:
+        """
+        Scroll the output.
+
+        :param delta: The number of lines to scroll down, or up if it's negative
+        :param height: The number of lines that fit in the pane
+        """
+        last_top = max(0, len(self.lines) - height)
+        top = last_top if self.top is None else self.top
+        top = max(0, min(top + delta, last_top))
+        self.top = None if top == last_top else top
+
+    def draw(self, screen: window, status: str) -> None:
+        """
+        Draw the pane over the whole of a window.
+
+        :param screen: The window to draw on
+        :param status: The line shown below the output
+        """
+        rows, cols = screen.getmaxyx()
+        height = max(0, rows - _FRAME_ROWS)
+        width = max(0, cols - 4)
+        with self._lock:
+            top = max(0, len(self.lines) - height) if self.top is None else self.top
+            shown = list(itertools.islice(self.lines, top, top + height))
+            dropped = self.line_count - len(self.lines)
+        if dropped:
+            status = f"{status} ({dropped} earlier lines dropped)"
+
+        screen.erase()
+        screen.border()
+        screen.addstr(1, 2, self.title[:width], curses.A_BOLD)
+        for row, line in enumerate(shown, start=2):
+            screen.addstr(row, 2, line[:width])
+        screen.addstr(rows - 2, 2, status[:width], curses.A_STANDOUT)
+        screen.noutrefresh()
+        curses.doupdate()
+
+    def run(self, screen: window, process: subprocess.Popen[str]) -> int:
+        """
+        Show the output of a process until the user closes the pane.
+
+        The process's stdout is read on another thread. The pane can be scrolled with
+        the arrow, page, home and end keys, and is closed with q or enter once the
+        process has finished. Pressing q before that terminates the process.
+
+        :param screen: The window to draw on
+        :param process: The process, with its output piped to stdout
+        :return: The exit status of the process
+        """
+        from cursesmenu.curses_menu import CursesMenu
+
+        assert process.stdout is not None
+        reader = threading.Thread(target=self.feed, args=(process.stdout,), daemon=True)
+        reader.start()
+
+        drawn = None
+        while True:
+            finished = process.poll() is not None and not reader.is_alive()
+            rows, cols = screen.getmaxyx()
+            height = max(0, rows - _FRAME_ROWS)
+            state = (self.line_count, self.top, finished, rows, cols)
+            if state != drawn:
+                drawn = state
+                if finished:
+                    status = f"Exited with status {process.returncode}, press q"
+                else:
+                    status = "Running, press q to stop"
+                self.draw(screen, status)
+
+            key = CursesMenu.input_multiplexer.read_key(screen, OUTPUT_POLL_INTERVAL)
+            scroll_keys = {
+                curses.KEY_UP: -1,
+                curses.KEY_DOWN: 1,
+                curses.KEY_PPAGE: -height,
+                curses.KEY_NPAGE: height,
+            }
+            if key in scroll_keys:
+                self.scroll(scroll_keys[key], height)
+            elif key == curses.KEY_HOME:
+                self.scroll(-len(self.lines), height)
+            elif key == curses.KEY_END:
+                self.top = None
+            elif key in (ord("q"), ord("\n")) and finished:
+                break
+            elif key == ord("q"):
+                self._stop(process, reader)
+                break
+        return process.returncode
+
+    @staticmethod
+    def _stop(process: subprocess.Popen[str], reader: threading.Thread) -> None:
+        """Terminate the process, or kill it if it doesn't stop in time."""
+        import subprocess
+
+        process.terminate()
+        try:
+            process.wait(timeout=STOP_TIMEOUT)
+        except subprocess.TimeoutExpired:
+            process.kill()
+            process.wait()
+        # The output might still be held open by a process that it started
+        reader.join(timeout=STOP_TIMEOUT)
@@ -0,0 +1,396 @@
+"""Searching and filtering the items in a menu."""
+
+from __future__ import annotations
+
+import re
+from collections.abc import Sequence
+from typing import TYPE_CHECKING, Any, cast, overload
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+    from concurrent.futures import Executor, Future
+
+    from cursesmenu.item_group import ItemGroup
+    from cursesmenu.items.menu_item import MenuItem
+else:
+    MenuItem = Any
+
+# Scores for fuzzy matching, loosely following fzf
+SCORE_MATCH = 16
+BONUS_BOUNDARY = 8
+BONUS_CONSECUTIVE = 4
+PENALTY_GAP_START = 3
+PENALTY_GAP_EXTENSION = 1
+
+# How many items a background search scores between checks for a newer query
+_CANCEL_CHECK_INTERVAL = 4096
+
+
+def fuzzy_pattern(query: str) -> re.Pattern[str]:
+    """
+    Compile a pattern that finds the query's characters in order, with gaps.
+
+    :param query: The casefolded query
+    :return: A pattern whose first match is the leftmost fuzzy match
+    """
+    return re.compile(".*?".join(map(re.escape, query)), re.DOTALL)
+
+
+def fuzzy_score(
+    query: str,
+    text: str,
+    pattern: re.Pattern[str] | None = None,
+) -> int | None:
+    """
+    Score how well a text matches a query whose characters it contains in order.
+
+    Matched characters score points, with bonuses for characters at the start of a
+    word and for runs of consecutive characters, and gaps between matched characters
+    are penalized. Both strings should already be casefolded.
+
+    :param query: The query
+    :param text: The text to score
+    :param pattern: The query's :func:`fuzzy_pattern`, if it's already compiled
+    :return: The score, or None if the text doesn't match
+    """
+    if not query:
+        return 0
+    if pattern is None:
+        pattern = fuzzy_pattern(query)
+    match = pattern.search(text)
+    if match is None:
+        return None
+
+    # The leftmost match can usually be tightened by matching backwards from its end
+    start = match.end() - 1
+    for char in reversed(query[:-1]):
+        start = text.rfind(char, match.start(), start)
+
+    score = 0
+    previous = start - 1
+    for char in query:
+        position = text.find(char, previous + 1)
+        score += SCORE_MATCH
+        if position == 0 or not text[position - 1].isalnum():
+            score += BONUS_BOUNDARY
+        if position != start:
+            gap = position - previous - 1
+            if gap:
+                score -= PENALTY_GAP_START + PENALTY_GAP_EXTENSION * (gap - 1)
+            else:
+                score += BONUS_CONSECUTIVE
+        previous = position
+    return score
+
+
+def is_subsequence(query: str, text: str) -> bool:
+    """Check whether the characters of the query appear in the text in order."""
+    characters = iter(text)
+    return all(char in characters for char in query)
+
+
+class TrigramIndex:
+    """
+    An index for finding the strings in a list that contain a substring.
+
+    Maps every three character substring to the positions of the strings that contain
+    it, so a search only has to check the strings that contain the query's rarest
+    trigram. Searches are case-insensitive.
+
+    :param texts: The strings to index
+    """
+
+    def __init__(self, texts: Iterable[str]) -> None:
+        """Build the index."""
+        self.texts = [text.casefold() for text in texts]
+        self.postings: dict[str, list[int]] = {}
+        for position, text in enumerate(self.texts):
+            for trigram in {text[i : i + 3] for i in range(len(text) - 2)}:
+                self.postings.setdefault(trigram, []).append(position)
+
+    def search(self, query: str) -> list[int]:
+        """
+        Find the strings that contain the query.
+
+        :param query: The substring to search for
+        :return: The positions of the matching strings, in order
+        """
+        query = query.casefold()
+        candidates: Sequence[int] = range(len(self.texts))
+        if len(query) >= 3:
+            postings = self.postings
+            candidates = min(
+                (postings.get(query[i : i + 3], []) for i in range(len(query) - 2)),
+                key=len,
+            )
+        texts = self.texts
+        return [position for position in candidates if query in texts[position]]
+
+
+class ItemFilter(Sequence[MenuItem]):
+    """
+    A view of the items in a group that match a search query.
+
+    The results are narrowed incrementally: when the query is extended, only the
+    previous matches are checked, and the results for earlier queries are remembered
+    so that deleting characters is free. Otherwise the search uses a
+    :class:`TrigramIndex` over the items' text. Everything is recomputed if the group
+    changes.
+
+    If an executor is given, the index is built on it as soon as the filter is
+    used, instead of on the caller's thread the first time it's needed. Until it's
+    ready, every item is checked.
+
+    :param group: The group of items to filter
+    :param query: The initial query
+    :param executor: Where to build the index, or None to build it when it's needed
+    """
+
+    def __init__(
+        self,
+        group: ItemGroup,
+        query: str = "",
+        executor: Executor | None = None,
+    ) -> None:
+        """Initialize the filter."""
+        self.group = group
+        self.executor = executor
+        self._query = query
+        self._version = -1
+        self._index: TrigramIndex | None = None
+        self._pending_index: Future[TrigramIndex] | None = None
+        self._texts: list[str] = []
+        self._results: dict[str, list[int]] = {}
+
+    @property
+    def query(self) -> str:
+        """Get the current query."""
+        return self._query
+
+    @query.setter
+    def query(self, query: str) -> None:
+        """Set the query and update the matches."""
+        self._query = query
+        self._update()
+
+    @property
+    def matches(self) -> list[int]:
+        """Get the positions in the group of the items that match the query."""
+        self._update()
+        return self._results[self._query.casefold()]
+
+    @property
+    def pending(self) -> bool:
+        """Check whether the matches for the query are still being searched for."""
+        return False
+
+    def poll(self) -> bool:
+        """
+        Collect the results of a search that finished in the background.
+
+        :return: True if the matches changed
+        """
+        return False
+
+    def cancel(self) -> None:
+        """Stop building the index in the background, if it hasn't started yet."""
+        if self._pending_index is not None:
+            self._pending_index.cancel()
+            self._pending_index = None
+
+    def _update(self) -> None:
+        if self._version != self.group.version:
+            self._reset()
+
+        query = self._query.casefold()
+        if query not in self._results:
+            self._search(query)
+
+    def _reset(self) -> None:
+        self.cancel()
+        self._version = self.group.version
+        self._texts = [text.casefold() for text in self.group.texts()]
+        self._index = None
+        self._results = {"": list(range(len(self._texts)))}
+        self._start_index()
+
+    def _start_index(self) -> None:
+        if self.executor is not None:
+            self._pending_index = self.executor.submit(TrigramIndex, self._texts)
+
+    def _get_index(self) -> TrigramIndex | None:
+        """Get the index, or None while it's still being built in the background."""
+        pending = self._pending_index
+        if self._index is None and pending is not None:
+            if not pending.done():
+                return None
+            self._pending_index = None
+            if not pending.cancelled():
+                self._index = pending.result()
+        if self._index is None:
+            self._index = TrigramIndex(self._texts)
+        return self._index
+
+    def _search(self, query: str) -> None:
+        narrower = [previous for previous in self._results if previous in query]
+        longest = max(narrower, key=len)
+        index = None
+        if not longest and len(query) >= 3:
+            index = self._get_index()
+        if index is None:
+            # Extending a query can only remove matches
+            texts = self._texts
+            matches = [
+                position
+                for position in self._results[longest]
+                if query in texts[position]
+            ]
+        else:
+            matches = index.search(query)
+        self._results[query] = matches
+
+    @overload
+    def __getitem__(self, i: int) -> MenuItem: ...
+
+    @overload
+    def __getitem__(self, i: slice) -> list[MenuItem]: ...
+
+    def __getitem__(self, i: int | slice) -> MenuItem | list[MenuItem]:
+        if isinstance(i, slice):
+            return [self.group[position] for position in self.matches[i]]
+        return self.group[self.matches[i]]
+
+    def __len__(self) -> int:
+        """Get the number of matching items."""
+        return len(self.matches)
+
+
+class FuzzyFilter(ItemFilter):
+    """
+    A view of the items in a group that fuzzy match a search query, best first.
+
+    An item matches if its text contains the query's characters in order, and the
+    matches are ranked by :func:`fuzzy_score`. When the query is extended, only the
+    matches for the earlier query are scored again.
+
+    If an executor is given, scoring is done on it instead of on the caller's thread.
+    Until it finishes, the matches for the last finished query are shown, and
+    :meth:`poll` has to be called to pick up the new ones. Starting a new search
+    abandons the previous one.
+
+    :param group: The group of items to filter
+    :param query: The initial query
+    :param executor: Where to score the items, or None to score them immediately
+    """
+
+    def __init__(
+        self,
+        group: ItemGroup,
+        query: str = "",
+        executor: Executor | None = None,
+    ) -> None:
+        """Initialize the filter."""
+        self._shown = ""
+        self._generation = 0
+        self._pending: Future[list[int] | None] | None = None
+        self._pending_query = ""
+        super().__init__(group, query, executor)
+
+    @property
+    def matches(self) -> list[int]:
+        """Get the positions of the items that match the query, best match first."""
+        self._update()
+        query = self._query.casefold()
+        if query in self._results:
+            self._shown = query
+        return self._results[self._shown]
+
+    @property
+    def pending(self) -> bool:
+        """Check whether the matches for the query are still being scored."""
+        self._update()
+        return self._pending is not None
+
+    def poll(self) -> bool:
+        """
+        Collect the results of scoring that finished in the background.
+
+        :return: True if the matches changed
+        """
+        pending = self._pending
+        if pending is None or not pending.done():
+            return False
+        self._pending = None
+        matches = pending.result()
+        assert matches is not None
+        self._results[self._pending_query] = matches
+        return True
+
+    def cancel(self) -> None:
+        """Abandon any scoring that's running in the background."""
+        self._generation += 1
+        if self._pending is not None:
+            self._pending.cancel()
+            self._pending = None
+
+    def _update(self) -> None:
+        super()._update()
+        if self._pending is not None and self._pending_query != self._query.casefold():
+            # The matches for the query were already known
+            self.cancel()
+
+    def _reset(self) -> None:
+        super()._reset()
+        self._shown = ""
+
+    def _start_index(self) -> None:
+        """Don't build an index, fuzzy matches can't be found with one."""
+
+    def _search(self, query: str) -> None:
+        if self._pending is not None and self._pending_query == query:
+            return
+        narrower = [
+            previous for previous in self._results if is_subsequence(previous, query)
+        ]
+        # Any text that matches the query also matches everything it extends
+        candidates = self._results[max(narrower, key=len)]
+
+        self.cancel()
+        if self.executor is None:
+            matches = self._rank(query, self._texts, candidates, self._generation)
+            assert matches is not None
+            self._results[query] = matches
+        else:
+            self._pending_query = query
+            self._pending = self.executor.submit(
+                self._rank,
+                query,
+                self._texts,
+                candidates,
+                self._generation,
+            )
+
+    def _rank(
+        self,
+        query: str,
+        texts: Sequence[str],
+        candidates: Sequence[int],
+        generation: int,
+    ) -> list[int] | None:
+        """
+        Score the candidates and sort the ones that match.
+
+        :return: The matching positions, or None if a newer search was started
+        """
+        pattern = fuzzy_pattern(query)
+        search = pattern.search
+        scored = []
+        for count, position in enumerate(candidates):
+            if count % _CANCEL_CHECK_INTERVAL == 0 and generation != self._generation:
+                return None
+            text = texts[position]
+            if search(text) is not None:
+                score = fuzzy_score(query, text, pattern)
+                scored.append((-cast(int, score), len(text), position))
+        scored.sort()
+        return [position for _, _, position in scored]
@@ -4,11 +4,17 @@ from __future__ import annotations
 
 import os
 import sys
+import time
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
     from typing import Callable
 
+# The frames of the spinner shown next to items that are running
+SPINNER = "|/-\\"
+# How long each frame of the spinner is shown, in seconds
+SPINNER_INTERVAL = 0.1
+
 
 def null_input_factory() -> Callable[[int], None]:
     """Create a lambda that takes a single input and does nothing."""
@@ -34,3 +40,8 @@ def soft_clear_terminal() -> None:
         os.system("")
     print(chr(27) + "[2J", end="")  # noqa: T201
     print(chr(27) + "[1;1H", end="")  # noqa: T201
+
+
+def spinner_frame() -> str:
+    """Get the frame of the spinner to show now."""
+    return SPINNER[int(time.monotonic() / SPINNER_INTERVAL) % len(SPINNER)]
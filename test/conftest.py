@@ -9,7 +9,7 @@ else:  # pragma: no cover all
 import pytest
 
 # noinspection PyUnresolvedReferences
-import cursesmenu.curses_menu  # noqa: F401
+import cursesmenu.curses_menu
 
 
 @pytest.fixture
@@ -39,10 +39,15 @@ def mock_curses_(rows, cols):
             "getch",
             "refresh",
             "clear",
+            "erase",
+            "timeout",
+            "noutrefresh",
             "getmaxyx",
             "resize",
         ],
     )
+    # ACS constants only exist once curses has been initialized
+    f.ACS_VLINE = ord("|")
 
     f.mock_window.getch.side_effect = lambda: 0
     f.mock_window.getmaxyx.return_value = (rows, cols)
@@ -69,8 +74,11 @@ def mock_curses():
 
 @pytest.fixture
 def mock_cursesmenu_curses(mock_curses):
+    cursesmenu.curses_menu.CursesMenu.currently_active_menu = None
+    cursesmenu.curses_menu.CursesMenu.input_multiplexer.window_timeout = -1
     with mock.patch("cursesmenu.curses_menu.curses", new=mock_curses) as f:
-        yield f
+        with mock.patch("cursesmenu.input_multiplexer.curses", new=mock_curses):
+            yield f
 
 
 @pytest.fixture
@@ -83,3 +91,9 @@ def mock_cursesmenu_curses_vary_window_size(mock_curses_window_size):
 def mock_externalitem_curses(mock_curses):
     with mock.patch("cursesmenu.items.external_item.curses", new=mock_curses) as f:
         yield f
+
+
+@pytest.fixture
+def mock_output_pane_curses(mock_curses):
+    with mock.patch("cursesmenu.output_pane.curses", new=mock_curses) as f:
+        yield f
@@ -0,0 +1,52 @@
+import pytest
+
+from cursesmenu.batch import BatchRunner
+from cursesmenu.items import CommandItem
+
+
+@pytest.fixture
+def items():
+    return [CommandItem("ok", "exit", ["0"]), CommandItem("fail", "exit", ["3"])]
+
+
+def test_batch(items):
+    runner = BatchRunner(items, max_workers=1)
+    assert not runner.poll()
+    runner.start()
+    assert all(item.status is not None for item in items)
+    for future in runner._futures:
+        future.result()
+    assert not runner.running
+    assert runner.poll()
+    assert not runner.poll()
+    assert runner.get_return() == {items[0]: 0, items[1]: 3}
+    assert not runner.succeeded
+
+
+def test_batch_succeeded(items):
+    runner = BatchRunner(items[:1])
+    runner.start()
+    for future in runner._futures:
+        future.result()
+    assert runner.succeeded
+
+
+def test_batch_empty():
+    runner = BatchRunner([])
+    assert not runner.poll()
+    runner.start()
+    # Finished straight away
+    assert runner.poll()
+    assert not runner.poll()
+    assert runner.get_return() == {}
+
+
+def test_batch_skips_running(items):
+    items[0].status = "running"
+    runner = BatchRunner(items)
+    runner.start()
+    assert runner.items == [items[1]]
+    for future in runner._futures:
+        future.result()
+    assert items[0].status == "running"
+    assert runner.get_return() == {items[1]: 3}
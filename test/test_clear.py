@@ -16,3 +16,7 @@ def test_clear():
         cursesmenu.utils.clear_terminal()
         mock_system.assert_called_once_with("reset")
     sys.platform = tmp_platform
+
+
+def test_null_input():
+    assert cursesmenu.utils.null_input_factory()(ord("x")) is None
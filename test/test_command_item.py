@@ -3,6 +3,7 @@ import sys
 
 import pytest
 
+from cursesmenu import CursesMenu
 from cursesmenu.items import CommandItem
 
 pytestmark = pytest.mark.usefixtures(
@@ -66,3 +67,74 @@ def test_create(create_item: CommandItem, delete_item: CommandItem):
     delete_item.action()
     assert delete_item.get_return() == 0
     assert not test_file_path.exists()
+
+
+def test_stream_output(mock_cursesmenu_curses, mock_output_pane_curses):
+    window = mock_cursesmenu_curses.mock_window
+    window.getch.side_effect = lambda: ord("\n")
+    menu = CursesMenu()
+    menu.screen = window
+    CursesMenu.stdscr = window
+    item = CommandItem("stream", "exit", arguments=["3"], stream_output=True, menu=menu)
+    item.set_up()
+    item.action()
+    item.clean_up()
+    assert item.get_return() == 3
+    mock_output_pane_curses.doupdate.assert_called()
+    window.timeout.assert_called_with(CursesMenu.input_multiplexer.window_timeout)
+
+
+def test_set_up(mock_cursesmenu_curses, mock_externalitem_curses):
+    menu = CursesMenu()
+    menu.screen = mock_cursesmenu_curses.mock_window
+    item = CommandItem("item", "exit", menu=menu)
+    item.set_up()
+    item.clean_up()
+    mock_externalitem_curses.endwin.assert_called_once()
+
+
+def test_run_quietly(create_item: CommandItem, delete_item: CommandItem):
+    assert create_item.show("1") == "1 - create_item"
+    assert create_item.run_quietly() == 0
+    assert not create_item.running
+    assert create_item.show("1") == "1 - create_item (exit 0)   "
+    with test_file_path.open("r") as f:
+        assert f.read().strip() == "hello"
+    assert delete_item.run_quietly() == 0
+
+    create_item.status = "running"
+    assert create_item.running
+    assert create_item.show("1")[:-3] == "1 - create_item (running"
+
+
+def test_run_quietly_fails(tmp_path: pathlib.Path):
+    item = CommandItem("item", "exit", stdout_filepath=tmp_path / "missing" / "out")
+    with pytest.raises(FileNotFoundError):
+        item.run_quietly()
+    assert item.show("1") == "1 - item (failed)   "
+
+
+@pytest.mark.parametrize("posix_spawn", [False, True])
+def test_exec(posix_spawn):
+    item = CommandItem(
+        "exec",
+        sys.executable,
+        arguments=["-c", "import sys; sys.exit(len(sys.argv[1]))", "a 'b' c"],
+        shell=False,
+        posix_spawn=posix_spawn,
+    )
+    assert item._get_args_list()[-1] == "a 'b' c"
+    item.action()
+    assert item.get_return() == 7
+    assert item.run_quietly() == 7
+
+
+def test_posix_spawn_kwargs():
+    item = CommandItem("exec", sys.executable, shell=False, posix_spawn=True, cwd=".")
+    kwargs = item._get_run_kwargs()
+    assert kwargs["executable"] is not None
+    assert not kwargs["close_fds"]
+    assert kwargs["cwd"] == "."
+    assert CommandItem("shell", "exit", posix_spawn=True)._get_run_kwargs() == {
+        "shell": True,
+    }
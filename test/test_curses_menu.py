@@ -1,9 +1,26 @@
 from __future__ import annotations
 
+import threading
+import time
+from concurrent.futures import Future
+from unittest import mock
+
 import pytest
 
-from cursesmenu import CursesMenu
-from cursesmenu.items import ExitItem, MenuItem
+from cursesmenu import CursesMenu, ItemGroup
+from cursesmenu.curses_menu import (
+    BACKGROUND_POLL_INTERVAL,
+    FILTER_POLL_INTERVAL,
+    INDEX_TEXT_CACHE_SIZE,
+    LOADING_INTERVAL,
+    PAD_SCREENS,
+    POST_POLL_INTERVAL,
+    VIEWPORT_OVERSCAN,
+    _stdin_fd,
+)
+from cursesmenu.items import CommandItem, ExitItem, FunctionItem, MenuItem
+from cursesmenu.navigator import MenuNavigator
+from cursesmenu.search import FuzzyFilter, ItemFilter
 
 pytestmark = pytest.mark.usefixtures("mock_cursesmenu_curses", "mock_clear")
 
@@ -105,6 +122,267 @@ def test_go_to_empty(empty_menu: CursesMenu):
     empty_menu.go_to(ord("1"))
 
 
+def test_go_to_multi_digit(big_menu: CursesMenu):
+    big_menu.go_to(ord("4"))
+    assert big_menu.current_option == 3
+    big_menu.go_to(ord("2"))
+    assert big_menu.current_option == 41
+    # There's no item 420, so a new index is started
+    big_menu.go_to(ord("0"))
+    assert big_menu.current_option == 41
+    assert big_menu._jump_buffer == "0"
+    big_menu.go_to(ord("7"))
+    assert big_menu.current_option == 6
+    big_menu.go_to(ord("1"))
+    assert big_menu.current_option == 70
+
+    # Keys typed too long after the last one start a new index
+    big_menu.jump_timeout = 0
+    with mock.patch("time.monotonic", side_effect=[100.0, 200.0]):
+        big_menu.go_to(ord("1"))
+        big_menu.go_to(ord("5"))
+    assert big_menu.current_option == 4
+
+
+def test_go_to_override_index(mock_cursesmenu_curses):
+    menu = CursesMenu("Test Menu")
+    menu.screen = mock_cursesmenu_curses.mock_window
+    CursesMenu.stdscr = mock_cursesmenu_curses.mock_window
+    menu.items.append(MenuItem("item0"))
+    menu.items.append(MenuItem("item1", override_index="a"))
+    menu.items.append(MenuItem("item2", override_index="bc"))
+    menu.items.append(MenuItem("item3"))
+    menu.end_items.append(MenuItem("end", override_index="x"))
+
+    # Keys without a handler go to go_to
+    menu.user_input_handlers[ord("a")](ord("a"))
+    assert menu.current_option == 1
+    menu.go_to(ord("b"))
+    menu.go_to(ord("c"))
+    assert menu.current_option == 2
+    menu.go_to(ord("4"))
+    assert menu.current_option == 3
+    # Items with an override index can't be jumped to by number
+    menu.go_to(ord("2"))
+    assert menu.current_option == 3
+    menu.go_to(ord("x"))
+    assert menu.current_option == 5
+
+    # The labels follow the items when they change
+    menu.items.insert(0, MenuItem("new", override_index="n"))
+    menu.go_to(ord("a"))
+    assert menu.current_option == 2
+    menu.go_to(ord("n"))
+    assert menu.current_option == 0
+    menu.filter_items("item")
+    menu.go_to(ord("a"))
+    assert menu.current_option == 1
+    menu.filter_items("item2")
+    menu.go_to(ord("q"))
+    assert menu.current_option == 1
+    menu.go_to(ord("b"))
+    menu.go_to(ord("c"))
+    assert menu.current_option == 0
+
+    # Keys that can't be part of an index are ignored
+    menu.go_to(ord(" "))
+    menu.go_to(265)
+    menu.go_to(-1)
+    menu.go_to(ord("z"))
+    assert menu.current_option == 0
+
+
+@pytest.fixture
+def paging_menu(mock_cursesmenu_curses):
+    window = mock_cursesmenu_curses.mock_window
+    window.getmaxyx.return_value = (10, 40)
+    menu = CursesMenu("Test Menu")
+    menu.items.extend(MenuItem(f"item{i}") for i in range(10))
+    menu.screen = window
+    CursesMenu.stdscr = window
+    return menu
+
+
+def test_paging(paging_menu: CursesMenu):
+    # Four items fit below the title on a 10 row screen
+    paging_menu.go_page_down()
+    assert paging_menu.current_option == 4
+    paging_menu.go_page_down()
+    paging_menu.go_page_down()
+    assert paging_menu.current_option == 10
+    paging_menu.go_page_up()
+    assert paging_menu.current_option == 6
+    paging_menu.go_page_up()
+    paging_menu.go_page_up()
+    assert paging_menu.current_option == 0
+    paging_menu.go_to_last()
+    assert paging_menu.current_option == 10
+    paging_menu.go_to_first()
+    assert paging_menu.current_option == 0
+
+    # Rows that aren't there any more aren't drawn
+    paging_menu.go_to_last()
+    del paging_menu.items[5:]
+    paging_menu.go_to_first()
+    assert paging_menu.current_option == 0
+
+    empty_menu = CursesMenu(show_exit_item=False)
+    empty_menu.go_to_last()
+    empty_menu.go_page_down()
+    assert empty_menu.current_option == 0
+
+
+def test_index_text(paging_menu: CursesMenu):
+    paging_menu.zero_pad = True
+    assert paging_menu._get_index_text(0) == "01"
+    assert paging_menu._get_index_text(0) is paging_menu._get_index_text(0)
+
+    # The padding only changes when the number of digits does
+    paging_menu.items.append(MenuItem("item10"))
+    assert paging_menu._get_index_text(0) == "01"
+    paging_menu.items.extend(MenuItem(f"item{i}") for i in range(100))
+    assert paging_menu._get_index_text(0) == "001"
+
+    for index in range(INDEX_TEXT_CACHE_SIZE + 1):
+        paging_menu._get_index_text(index)
+    assert len(paging_menu._index_texts) == 1
+
+    paging_menu.zero_pad = False
+    assert paging_menu._get_index_text(0) == "1"
+
+
+def test_input_batching(paging_menu, mock_cursesmenu_curses):
+    curses = mock_cursesmenu_curses
+    window = curses.mock_window
+    paging_menu.get_input = lambda: curses.KEY_DOWN
+
+    # Queued movement is handled at once, and only the net movement is drawn
+    window.getch.side_effect = [curses.KEY_DOWN, curses.KEY_NPAGE, curses.KEY_UP, 10]
+    window.addstr.reset_mock()
+    paging_menu.process_user_input()
+    assert paging_menu.current_option == 5
+    assert [c.args[0] for c in window.addstr.call_args_list] == [5, 10]
+    assert paging_menu.last_input_flushes == 1
+    # Selecting has to wait for the menu to be drawn
+    curses.ungetch.assert_called_once_with(10)
+    # The multiplexer knows what the window was left waiting for
+    window.timeout.assert_called_with(CursesMenu.input_multiplexer.window_timeout)
+
+    curses.ungetch.reset_mock()
+    window.getch.side_effect = [-1]
+    paging_menu.process_user_input()
+    assert paging_menu.current_option == 6
+    curses.ungetch.assert_not_called()
+
+    # Moves wrap around, and batches have a limit
+    paging_menu.get_input = lambda: curses.KEY_UP
+    window.getch.side_effect = [curses.KEY_UP] * 10
+    with mock.patch("cursesmenu.curses_menu.MAX_INPUT_BATCH", 8):
+        paging_menu.process_user_input()
+    assert paging_menu.current_option == 9
+
+    # So does anything that redraws the whole menu
+    paging_menu.get_input = lambda: ord("/")
+    window.getch.side_effect = [ord("i"), ord("t"), 127, ord("t"), -1]
+    paging_menu.process_user_input()
+    assert paging_menu.item_filter.query == "it"
+    assert paging_menu.last_input_flushes == 1
+
+    # Anything else is handled by itself
+    paging_menu.get_input = lambda: 10
+    window.getch.reset_mock()
+    paging_menu.process_user_input()
+    window.getch.assert_not_called()
+    assert paging_menu.selected_option == 0
+
+    empty_menu = CursesMenu(show_exit_item=False)
+    empty_menu.get_input = lambda: curses.KEY_UP
+    window.getch.side_effect = [-1]
+    empty_menu.process_user_input()
+    assert empty_menu.current_option == 0
+
+
+def test_frame_rate_limit(paging_menu, mock_cursesmenu_curses):
+    window = mock_cursesmenu_curses.mock_window
+    window.getch.side_effect = lambda: -1
+    CursesMenu.input_multiplexer.window_timeout = -1
+    paging_menu.max_fps = 10
+    patch_draw = mock.patch.object(paging_menu, "draw", wraps=paging_menu.draw)
+    with mock.patch("time.monotonic") as monotonic, patch_draw as draw:
+        monotonic.return_value = 100.0
+        paging_menu.items.append(MenuItem("new item"))
+        paging_menu.schedule_draw()
+        draw.assert_not_called()
+        paging_menu.process_user_input()
+        window.timeout.assert_called_with(0)
+        draw.assert_called_once()
+
+        # Changes made too soon after a frame wait for the next one
+        paging_menu.items.append(MenuItem("new item"))
+        monotonic.return_value = 100.06
+        paging_menu.process_user_input()
+        window.timeout.assert_called_with(40)
+        draw.assert_called_once()
+        monotonic.return_value = 100.2
+        paging_menu.process_user_input()
+        assert draw.call_count == 2
+
+        # Idle menus still wake up for changes made by other threads
+        paging_menu.process_user_input()
+        window.timeout.assert_called_with(100)
+        assert draw.call_count == 2
+
+        # Frames are drawn after handling input too
+        paging_menu.items.append(MenuItem("new item"))
+        monotonic.return_value = 101.0
+        window.getch.side_effect = [mock_cursesmenu_curses.KEY_DOWN, -1]
+        paging_menu.process_user_input()
+        assert draw.call_count == 3
+        paging_menu.items.append(MenuItem("new item"))
+        monotonic.return_value = 102.0
+        window.getch.side_effect = [10]
+        paging_menu.process_user_input()
+        assert draw.call_count == 5
+        assert paging_menu.selected_option == 1
+
+
+def test_schedule_draw_without_limit(paging_menu, mock_cursesmenu_curses):
+    mock_cursesmenu_curses.mock_window.getch.side_effect = lambda: -1
+    patch_wake = mock.patch.object(CursesMenu.input_multiplexer, "wake")
+    with mock.patch.object(paging_menu, "draw") as draw, patch_wake as wake:
+        # Called from another thread, so it's left to the menu's own
+        thread = threading.Thread(target=paging_menu.schedule_draw)
+        thread.start()
+        thread.join()
+        paging_menu.schedule_draw()
+        draw.assert_not_called()
+        wake.assert_called_once_with()
+        assert paging_menu.input_delay == -1
+        paging_menu.process_user_input()
+        draw.assert_called_once()
+        paging_menu.process_user_input()
+        draw.assert_called_once()
+
+        paging_menu.screen = None
+        paging_menu.schedule_draw()
+        paging_menu.process_user_input()
+        draw.assert_called_once()
+
+
+def test_flush_count(paging_menu, mock_cursesmenu_curses):
+    doupdate = mock_cursesmenu_curses.doupdate
+    flushes = CursesMenu.flush_count
+    paging_menu.draw()
+    assert CursesMenu.flush_count == flushes + 1
+    doupdate.assert_called_once()
+
+    # Clearing waits for whatever is drawn next
+    paging_menu.clear_screen()
+    assert CursesMenu.flush_count == flushes + 1
+    paging_menu.go_down()
+    assert CursesMenu.flush_count == flushes + 2
+
+
 def test_select(sample_menu: CursesMenu, sample_items: list[MenuItem]):
     sample_menu.select()
     assert sample_menu.current_option == 0
@@ -121,6 +399,301 @@ def test_select(sample_menu: CursesMenu, sample_items: list[MenuItem]):
     assert not sample_menu.is_alive()
 
 
+def test_multi_select(mock_cursesmenu_curses):
+    window = mock_cursesmenu_curses.mock_window
+    menu = CursesMenu("menu", multi_select=True, max_batch_workers=1)
+    items = [CommandItem("ok", "exit", ["0"]), CommandItem("fail", "exit", ["2"])]
+    menu.items.extend([*items, MenuItem("other")])
+    menu.screen = window
+    CursesMenu.stdscr = window
+    toggle = menu.user_input_handlers[ord(" ")]
+
+    toggle(ord(" "))
+    window.addstr.assert_any_call(5, 2, "*")
+    menu.go_down()
+    toggle(ord(" "))
+    menu.go_down()
+    toggle(ord(" "))
+    assert menu.marked_items == set(items)
+    toggle(ord(" "))
+    menu.go_up()
+    toggle(ord(" "))
+    toggle(ord(" "))
+    assert menu.marked_items == set(items)
+
+    # Selecting runs the marked items instead of the current one
+    menu.select()
+    assert not menu.marked_items
+    runner = menu._background_items[0]
+    for future in runner._futures:
+        future.result()
+    menu.get_input = lambda: -1
+    menu.process_user_input()
+    assert menu.returned_value == {items[0]: 0, items[1]: 2}
+    assert not menu.should_exit
+
+
+def test_multi_select_filtered(mock_cursesmenu_curses):
+    window = mock_cursesmenu_curses.mock_window
+    menu = CursesMenu("menu", multi_select=True, max_batch_workers=1)
+    items = [CommandItem("ok", "exit", ["0"]), CommandItem("fail", "exit", ["2"])]
+    menu.items.extend(items)
+    menu.screen = window
+    CursesMenu.stdscr = window
+    menu.marked_items.update(items)
+
+    # The marked item that the filter hides runs as well
+    menu.filter_items("fail")
+    assert list(menu.all_items) == [items[1], menu.end_items[0]]
+    menu.select()
+    assert not menu.marked_items
+    runner = menu._background_items[0]
+    assert [future.result() for future in runner._futures] == [0, 2]
+
+
+def test_multi_select_removed(mock_cursesmenu_curses):
+    menu = CursesMenu("menu", multi_select=True)
+    menu.screen = mock_cursesmenu_curses.mock_window
+    items = [CommandItem(f"item{i}", "exit", ["0"]) for i in range(5)]
+    menu.items.extend(items)
+    menu.marked_items.update(items)
+
+    # Items that leave the group aren't run
+    del menu.items[0]
+    menu.items.remove(items[1])
+    menu.items[0] = MenuItem("replacement")
+    assert menu.marked_items == set(items[3:])
+    # Unlike ones that are put back in
+    menu.items.replace_all(reversed(menu.items))
+    assert menu.marked_items == set(items[3:])
+    del menu.items[:]
+    assert not menu.marked_items
+    menu.items.extend(items)
+    menu.items.clear()
+    assert not menu.marked_items
+
+
+def test_select_background(paging_menu, mock_cursesmenu_curses):
+    window = mock_cursesmenu_curses.mock_window
+    futures = [Future(), Future()]
+    executor = mock.Mock()
+    executor.submit.side_effect = futures
+    function = mock.Mock(return_value=1)
+    item = FunctionItem("item", function, executor=executor, should_exit=True)
+    paging_menu.items.append(item)
+    paging_menu.go_to_last()
+    paging_menu.go_up()
+    paging_menu.select()
+    assert item.running
+    assert paging_menu.returned_value is None
+    assert not paging_menu.should_exit
+    paging_menu.select()
+
+    # The menu keeps drawing the spinner until the function finishes
+    paging_menu.get_input = lambda: -1
+    window.addstr.reset_mock()
+    paging_menu.process_user_input()
+    window.addstr.assert_called()
+    futures[0].set_result(1)
+    paging_menu.process_user_input()
+    assert paging_menu.returned_value == 1
+    assert paging_menu.should_exit
+    window.addstr.reset_mock()
+    paging_menu.process_user_input()
+    window.addstr.assert_not_called()
+
+
+def test_post(paging_menu, mock_cursesmenu_curses):
+    window = mock_cursesmenu_curses.mock_window
+    window.getch.side_effect = lambda: -1
+    assert paging_menu.input_delay == -1
+
+    def produce():
+        for i in range(3):
+            paging_menu.items.append_threadsafe(MenuItem(f"new item {i}"))
+
+    producer = threading.Thread(target=produce)
+    producer.start()
+    producer.join()
+    assert len(paging_menu.items) == 10
+    assert paging_menu.input_delay == POST_POLL_INTERVAL
+
+    window.erase.reset_mock()
+    with mock.patch.object(paging_menu, "draw", wraps=paging_menu.draw) as draw:
+        paging_menu.process_user_input()
+        assert len(paging_menu.items) == 13
+        draw.assert_called_once()
+        # The pad grew, so the old bottom border is erased
+        window.erase.assert_called_once()
+
+        # Changes to the items themselves are drawn too
+        draw.reset_mock()
+        paging_menu.post(lambda: setattr(paging_menu.items[0], "text", "changed"))
+        paging_menu.process_user_input()
+        draw.assert_called_once()
+
+        draw.reset_mock()
+        paging_menu.process_user_input()
+        draw.assert_not_called()
+
+    # Unless the wait for a key can be woken up for the next change
+    with mock.patch.object(CursesMenu.input_multiplexer, "input_fd", 0):
+        assert paging_menu.input_delay == -1
+    with mock.patch.object(CursesMenu.input_multiplexer, "wake") as wake:
+        paging_menu.post(lambda: None)
+        wake.assert_called_once_with()
+    paging_menu.process_user_input()
+
+
+def test_stdin_fd():
+    # pytest replaces stdin with something that isn't a file
+    assert _stdin_fd() is None
+    with mock.patch("sys.stdin") as stdin:
+        stdin.fileno.return_value = 0
+        assert _stdin_fd() == 0
+
+
+def process_until(menu, condition):
+    deadline = time.monotonic() + 10
+    while not condition():
+        assert time.monotonic() < deadline
+        menu.process_user_input()
+
+
+def test_from_iterable(mock_cursesmenu_curses):
+    window = mock_cursesmenu_curses.mock_window
+    window.getch.side_effect = lambda: -1
+    CursesMenu.stdscr = window
+    proceed = threading.Event()
+
+    def produce():
+        yield from "abc"
+        proceed.wait(timeout=10)
+        yield "d"
+
+    menu = CursesMenu.from_iterable(produce(), "title", chunk_size=2)
+    menu.screen = window
+    assert menu.loaded_count == 0
+    assert menu.input_delay == LOADING_INTERVAL
+    # Including the part of a chunk that was read before the source stalled
+    process_until(menu, lambda: menu.loaded_count == 3)
+    assert [item.text for item in menu.items] == ["a", "b", "c"]
+    window.addstr.assert_any_call(
+        4,
+        2,
+        "(loading 3...)",
+        mock_cursesmenu_curses.A_BOLD,
+    )
+
+    window.erase.reset_mock()
+    proceed.set()
+    process_until(menu, lambda: menu.loaded_count is None)
+    assert [item.text for item in menu.items] == ["a", "b", "c", "d"]
+    assert menu.items[3].index == 3
+    assert menu.loading_error is None
+    window.erase.assert_called()
+
+
+def test_from_iterable_viewport(mock_cursesmenu_curses):
+    window = mock_cursesmenu_curses.mock_window
+    window.getch.side_effect = lambda: -1
+    window.getmaxyx.return_value = (10, 40)
+    CursesMenu.stdscr = window
+    texts = [f"item{i}" for i in range(1000)]
+    menu = CursesMenu.from_iterable(texts, chunk_size=100)
+    assert menu.viewport_rendering
+    menu.screen = window
+    process_until(menu, lambda: menu.loaded_count is None)
+    assert len(menu.items) == 1000
+    # Each chunk only redraws the rows on the screen, not every item so far
+    drawn = [call for call in window.addstr.call_args_list if "item" in call.args[2]]
+    assert len(drawn) < 100
+
+
+def test_from_iterable_chunks(mock_cursesmenu_curses):
+    CursesMenu.stdscr = mock_cursesmenu_curses.mock_window
+    menu = CursesMenu()
+    menu.loaded_count = 0
+    added = []
+
+    def post(function):
+        function()
+        added.append(len(menu.items))
+
+    with mock.patch.object(menu, "post", side_effect=post):
+        menu._load_selections(iter("abcde"), 2)
+    # Full chunks are added as soon as they're read
+    assert added == [2, 4, 5]
+    assert menu.loaded_count is None
+
+    menu.loaded_count = 0
+    with mock.patch.object(menu, "post") as post:
+        menu._load_selections(iter("abcde"), 2)
+    # Once until the menu adds them
+    assert post.call_count == 2
+
+
+def test_from_iterable_error(mock_cursesmenu_curses):
+    window = mock_cursesmenu_curses.mock_window
+    window.getch.side_effect = lambda: -1
+    CursesMenu.stdscr = window
+
+    def produce():
+        yield "a"
+        raise ValueError
+
+    menu = CursesMenu.from_iterable(produce(), "title", "subtitle")
+    menu.screen = window
+    process_until(menu, lambda: menu.loaded_count is None)
+    assert [item.text for item in menu.items] == ["a"]
+    assert isinstance(menu.loading_error, ValueError)
+    window.addstr.assert_any_call(
+        4,
+        2,
+        "subtitle (failed: ValueError)",
+        mock_cursesmenu_curses.A_BOLD,
+    )
+
+
+def test_from_iterable_exit(mock_cursesmenu_curses):
+    window = mock_cursesmenu_curses.mock_window
+    window.getch.side_effect = lambda: -1
+    CursesMenu.stdscr = window
+    proceed = threading.Event()
+
+    def produce():
+        yield "a"
+        proceed.wait(timeout=10)
+        yield "b"
+
+    menu = CursesMenu.from_iterable(produce(), "title", "subtitle")
+    process_until(menu, lambda: menu.loaded_count == 1)
+    menu.should_exit = True
+    proceed.set()
+    process_until(menu, lambda: menu.loaded_count is None)
+    assert len(menu.items) == 1
+
+
+def test_background_input_timeout(paging_menu, mock_cursesmenu_curses):
+    window = mock_cursesmenu_curses.mock_window
+    future = Future()
+    function = mock.Mock(return_value=1)
+    item = FunctionItem("item", function, executor=mock.Mock())
+    item.executor.submit.return_value = future
+    paging_menu.items.append(item)
+    paging_menu.go_to_last()
+    paging_menu.go_up()
+    paging_menu.select()
+    paging_menu.get_input()
+    window.timeout.assert_called_with(BACKGROUND_POLL_INTERVAL)
+
+    future.set_result(1)
+    paging_menu.get_input = lambda: -1
+    paging_menu.process_user_input()
+    assert paging_menu.returned_value == 1
+    assert not paging_menu.should_exit
+
+
 def test_go_to_exit(sample_menu: CursesMenu):
     sample_menu.go_to_exit()
     assert sample_menu.current_option == 2
@@ -153,6 +726,307 @@ def test_append_while_running(sample_menu: CursesMenu):
         sample_menu.items.append(new_item)
 
 
+def test_all_items_view(sample_menu: CursesMenu, sample_items: list[MenuItem]):
+    all_items = sample_menu.all_items
+    assert sample_menu.all_items is all_items
+    new_item = MenuItem("item2")
+    sample_menu.items.append(new_item)
+    assert sample_menu.all_items is all_items
+    assert all_items[2] is new_item
+    assert isinstance(all_items[3], ExitItem)
+
+    sample_menu.items = ItemGroup(sample_menu, sample_items[:1])
+    assert sample_menu.all_items is not all_items
+    assert list(sample_menu.all_items) == [sample_items[0], *sample_menu.end_items]
+
+
+def test_viewport_rendering(mock_cursesmenu_curses):
+    window = mock_cursesmenu_curses.mock_window
+    window.getmaxyx.return_value = (10, 40)
+    menu = CursesMenu("Test Menu", viewport_rendering=True)
+    for i in range(1000):
+        menu.items.append(MenuItem(f"item{i}"))
+    menu.start()
+    menu.wait_for_start(timeout=10)
+
+    assert menu.visible_item_range() == range(5 + VIEWPORT_OVERSCAN)
+    window.addstr.reset_mock()
+    menu.draw()
+    # title and subtitle, plus one call per item drawn
+    assert window.addstr.call_count == 2 + 5 + VIEWPORT_OVERSCAN
+
+    menu.go_to_exit()
+    assert menu.visible_item_range() == range(1001 - 9 - VIEWPORT_OVERSCAN, 1001)
+
+    menu.exit()
+    menu.join(timeout=10)
+
+
+def test_incremental_redraw(
+    sample_menu: CursesMenu,
+    mock_cursesmenu_curses_vary_window_size,
+):
+    window = mock_cursesmenu_curses_vary_window_size.mock_window
+    window.reset_mock()
+    mock_cursesmenu_curses_vary_window_size.doupdate.reset_mock()
+    sample_menu.go_down()
+    window.border.assert_not_called()
+    assert window.addstr.call_count == 2
+    window.noutrefresh.assert_called_once()
+    mock_cursesmenu_curses_vary_window_size.doupdate.assert_called_once()
+
+    window.reset_mock()
+    sample_menu.go_to(ord("2"))
+    assert window.addstr.call_count == 1
+
+
+def test_incremental_redraw_viewport(mock_cursesmenu_curses):
+    window = mock_cursesmenu_curses.mock_window
+    window.getmaxyx.return_value = (10, 40)
+    menu = CursesMenu("Test Menu", viewport_rendering=True)
+    for i in range(100):
+        menu.items.append(MenuItem(f"item{i}"))
+    menu.start()
+    menu.wait_for_start(timeout=10)
+
+    window.reset_mock()
+    menu.go_down()
+    window.border.assert_not_called()
+    # Scrolled down by one, the rows in the new viewport have to be drawn
+    assert window.addstr.call_count == len(menu.visible_item_range())
+
+    window.reset_mock()
+    menu.go_up()
+    assert window.addstr.call_count == len(menu.visible_item_range())
+
+    window.reset_mock()
+    menu.go_up()
+    # Wrapped around to the exit item, so the old row is outside the viewport
+    assert window.addstr.call_count == len(menu.visible_item_range()) + 1
+
+    menu.items.clear()
+    menu.current_option = 100
+    window.reset_mock()
+    menu.go_down()
+    assert window.addstr.call_count == 1
+
+    menu.exit()
+    menu.join(timeout=10)
+
+
+@pytest.fixture
+def mock_pad(mock_cursesmenu_curses):
+    """Give the menu its own pad that tracks its size, separate from stdscr."""
+    pad = mock.MagicMock()
+
+    def newpad(rows, cols):
+        pad.getmaxyx.return_value = (rows, cols)
+        return pad
+
+    def resize(rows, cols):
+        pad.getmaxyx.return_value = (rows, cols)
+
+    mock_cursesmenu_curses.newpad.side_effect = newpad
+    pad.resize.side_effect = resize
+    return pad
+
+
+def test_bounded_pad(mock_cursesmenu_curses, mock_pad):
+    window = mock_cursesmenu_curses.mock_window
+    window.getmaxyx.return_value = (10, 40)
+    menu = CursesMenu("Test Menu", bounded_pad=True)
+    assert menu.viewport_rendering
+    for i in range(1000):
+        menu.items.append(MenuItem(f"item{i}"))
+    menu.start()
+    menu.wait_for_start(timeout=10)
+    mock_cursesmenu_curses.newpad.assert_called_once_with(PAD_SCREENS * 10, 40)
+    mock_pad.border.assert_called_with(0, 0, 0, ord(" "), 0, 0, ord("|"), ord("|"))
+
+    mock_pad.reset_mock()
+    menu.go_down()
+    mock_pad.erase.assert_not_called()
+    mock_pad.noutrefresh.assert_called_once_with(1, 0, 0, 0, 9, 39)
+
+    # Moving outside of the pad moves the pad and draws it from scratch
+    mock_pad.reset_mock()
+    menu.go_up()
+    menu.go_up()
+    mock_pad.erase.assert_called_once()
+    mock_pad.border.assert_called_once_with(
+        0,
+        0,
+        ord(" "),
+        0,
+        ord("|"),
+        ord("|"),
+        0,
+        0,
+    )
+    top_row = menu.menu_height - 10
+    pad_top = menu.menu_height - PAD_SCREENS * 10
+    mock_pad.noutrefresh.assert_called_with(top_row - pad_top, 0, 0, 0, 9, 39)
+    # Only the visible rows are drawn, the rows above the pad are skipped
+    for call in mock_pad.addstr.call_args_list:
+        assert 0 <= call.args[0] < PAD_SCREENS * 10
+    mock_pad.reset_mock()
+    menu.draw_item(0, menu.items[0])
+    mock_pad.addstr.assert_not_called()
+
+    # The pad shrinks along with the menu, and what was below it is cleared
+    window.reset_mock()
+    menu.items[10:] = []
+    assert mock_pad.getmaxyx()[0] == menu.menu_height
+    window.erase.assert_called_once()
+    window.noutrefresh.assert_called_once()
+    mock_pad.border.assert_called_with(0, 0, 0, 0, 0, 0, 0, 0)
+
+    menu.exit()
+    menu.join(timeout=10)
+
+
+def test_filter_input(mock_cursesmenu_curses):
+    CursesMenu.stdscr = mock_cursesmenu_curses.mock_window
+    menu = CursesMenu("Test Menu")
+    menu.screen = mock_cursesmenu_curses.mock_window
+    for text in ["apple", "banana", "grape"]:
+        menu.items.append(MenuItem(text))
+    keys = iter("xap")
+    menu.get_input = lambda: ord(next(keys))
+
+    # Not filtering, letters go to their normal handlers
+    menu.process_user_input()
+    assert menu.item_filter is None
+    menu.start_filter()
+    assert menu.item_filter is not None
+    assert menu.item_filter.query == ""
+
+    menu.current_option = 1
+    menu.process_user_input()
+    assert menu.current_option == 0
+    menu.process_user_input()
+    assert menu.item_filter.query == "ap"
+    assert [item.text for item in menu.all_items] == ["apple", "grape", "Exit"]
+    assert menu.last_item_index == 2
+
+    # Other keys still go to their handlers
+    handler = mock.Mock()
+    menu.user_input_handlers[300] = handler
+    menu.get_input = lambda: 300
+    menu.process_user_input()
+    handler.assert_called_once_with(300)
+
+    menu.get_input = lambda: 127
+    menu.process_user_input()
+    assert menu.item_filter.query == "a"
+    menu.process_user_input()
+    assert menu.item_filter.query == ""
+    menu.process_user_input()
+    assert menu.item_filter is None
+    assert len(menu.all_items) == 4
+
+    menu.filter_items("ban")
+    menu.get_input = lambda: 27
+    menu.process_user_input()
+    assert menu.item_filter is None
+
+
+def test_filter_while_running(mock_cursesmenu_curses):
+    window = mock_cursesmenu_curses.mock_window
+    menu = CursesMenu("Test Menu", "subtitle")
+    for text in ["apple", "banana", "grape"]:
+        menu.items.append(MenuItem(text, should_exit=True))
+    menu.start()
+    menu.wait_for_start(timeout=10)
+
+    window.reset_mock()
+    menu.filter_items("ban")
+    window.erase.assert_called()
+    window.addstr.assert_any_call(4, 2, "/ban", mock_cursesmenu_curses.A_BOLD)
+    menu.select()
+    menu.join(timeout=10)
+    assert menu.selected_item is menu.items[1]
+
+
+def test_filter_index_background(mock_cursesmenu_curses):
+    menu = CursesMenu("Test Menu")
+    menu.screen = mock_cursesmenu_curses.mock_window
+    for text in ["apple", "banana", "grape"]:
+        menu.items.append(MenuItem(text))
+    with mock.patch("cursesmenu.curses_menu.FILTER_BACKGROUND_ITEMS", 3):
+        menu.filter_items("")
+    # The index is built as soon as the filter opens
+    assert isinstance(menu.item_filter, ItemFilter)
+    assert menu.item_filter.executor is menu._filter_executor
+    assert menu.item_filter._pending_index is not None
+    menu.item_filter._pending_index.result(timeout=10)
+    menu.filter_items("ana")
+    assert [item.text for item in menu.all_items] == ["banana", "Exit"]
+    assert menu.item_filter._index is not None
+    menu.close_screen()
+
+
+def test_fuzzy_filter(mock_cursesmenu_curses):
+    window = mock_cursesmenu_curses.mock_window
+    menu = CursesMenu("Test Menu", fuzzy=True)
+    for text in ["apple", "banana", "grape"]:
+        menu.items.append(MenuItem(text, should_exit=True))
+    menu.filter_items("ape")
+    assert isinstance(menu.item_filter, FuzzyFilter)
+    assert menu.item_filter.executor is None
+    assert [item.text for item in menu.all_items] == ["apple", "grape", "Exit"]
+
+    # Big menus are scored in the background, and the results shown when they're ready
+    CursesMenu.stdscr = window
+    menu.screen = window
+    with mock.patch("cursesmenu.curses_menu.FILTER_BACKGROUND_ITEMS", 3):
+        menu.filter_items(None)
+        menu.filter_items("grp")
+        executor = menu._filter_executor
+        assert executor is not None
+        menu.filter_items(None)
+        menu.filter_items("grp")
+    assert menu._filter_executor is executor
+    assert menu.item_filter.executor is executor
+    assert menu.item_filter.pending
+    assert len(menu.all_items) == 4
+    menu.item_filter._pending.result(timeout=10)
+
+    window.reset_mock()
+    menu.process_user_input()
+    assert window.timeout.call_args_list[0] == mock.call(FILTER_POLL_INTERVAL)
+    window.erase.assert_called()
+    assert [item.text for item in menu.all_items] == ["grape", "Exit"]
+    window.timeout.reset_mock()
+    menu.process_user_input()
+    assert window.timeout.call_args_list[0] == mock.call(-1)
+
+    menu.start()
+    menu.wait_for_start(timeout=10)
+    menu.select()
+    menu.join(timeout=10)
+    assert menu.selected_item is menu.items[2]
+    assert menu._filter_executor is None
+
+
+def test_fuzzy_filter_pending(mock_cursesmenu_curses):
+    window = mock_cursesmenu_curses.mock_window
+    menu = CursesMenu("Test Menu")
+    menu.items.append(MenuItem("apple"))
+    executor = mock.Mock()
+    executor.submit.return_value = future = Future()
+    menu.item_filter = FuzzyFilter(menu.items, "ap", executor)
+    menu.screen = window
+    CursesMenu.stdscr = window
+    menu.draw()
+    window.addstr.assert_any_call(4, 2, "/ap ...", mock_cursesmenu_curses.A_BOLD)
+
+    menu.filter_items(None)
+    assert future.cancelled()
+    menu.filter_items(None)
+    assert menu.item_filter is None
+
+
 def test_init():
     menu1 = CursesMenu()
     menu2 = CursesMenu("menu2", "test_init", show_exit_item=True)
@@ -167,12 +1041,16 @@ def test_init():
     assert menu3.subtitle == "test_init"
 
 
-def test_null_screens_main_loop():
+def test_null_screens_run():
     menu = CursesMenu("menu", "empty menu", show_exit_item=False)
     CursesMenu.stdscr = None
     menu.get_input = menu._exit_with_return
-    with pytest.raises((AttributeError, AssertionError)):
-        menu._main_loop()
+    # The menu can't be opened without curses having been initialized
+    navigator = MenuNavigator(menu)
+    with pytest.raises(AssertionError):
+        navigator.run()
+    assert menu.screen is None
+    assert not menu.should_exit
 
 
 def test_repr(sample_menu: CursesMenu):
@@ -25,3 +25,11 @@ def test_show(exit_item):
 
 def test_show_with_parent(exit_item_with_parent):
     assert exit_item_with_parent.show("q") == "q - Return to root_menu menu"
+
+
+def test_show_after_parent_changes(exit_item_with_parent):
+    parent = exit_item_with_parent.menu.parent
+    parent.title = "renamed"
+    assert exit_item_with_parent.show("q") == "q - Return to renamed menu"
+    exit_item_with_parent.menu.parent = None
+    assert exit_item_with_parent.show("q") == "q - Exit"
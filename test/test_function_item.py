@@ -1,5 +1,11 @@
+import asyncio
+import threading
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from unittest import mock
+
 import pytest
 
+from cursesmenu import CursesMenu
 from cursesmenu.items import FunctionItem
 
 pytestmark = pytest.mark.usefixtures(
@@ -23,7 +29,131 @@ def test_basic_function():
     assert item.get_return() == 2
 
 
+def test_set_up(mock_externalitem_curses, mock_cursesmenu_curses):
+    item = FunctionItem("get_two", get_two, menu=CursesMenu())
+    item.menu.screen = mock_cursesmenu_curses.mock_window
+    item.set_up()
+    item.clean_up()
+    mock_externalitem_curses.endwin.assert_called_once()
+    mock_externalitem_curses.reset_prog_mode.assert_called_once()
+
+
 def test_function_with_args():
     item = FunctionItem("add", add, args=[2], kwargs={"two_two": 2})
     item.action()
     assert item.get_return() == 4
+
+
+def fail():
+    raise ValueError
+
+
+def test_background_function(mock_externalitem_curses):
+    future = Future()
+    executor = mock.Mock()
+    executor.submit.return_value = future
+    item = FunctionItem("add", add, args=[2, 2], executor=executor)
+    item.set_up()
+    item.action()
+    item.clean_up()
+    mock_externalitem_curses.endwin.assert_not_called()
+    executor.submit.assert_called_once_with(add, 2, 2)
+    assert item.running
+    assert not item.poll()
+    assert item.show("1")[:-1] == "1 - add "
+
+    # Selecting it again while it's running does nothing
+    item.action()
+    executor.submit.assert_called_once()
+
+    future.set_result(4)
+    assert item.poll()
+    assert not item.running
+    assert item.get_return() == 4
+    assert item.show("1") == "1 - add"
+    assert not item.poll()
+
+
+def test_background_function_fails():
+    item = FunctionItem("fail", fail, background=True)
+    shut_down = threading.Event()
+    shutdown = mock.patch.object(
+        ThreadPoolExecutor,
+        "shutdown",
+        autospec=True,
+        side_effect=lambda *_, **__: shut_down.set(),
+    )
+    with shutdown as mock_shutdown:
+        item.action()
+        assert item.future is not None
+        item.future.exception()
+        # The item's thread goes away once the function finishes
+        assert shut_down.wait(timeout=10)
+    mock_shutdown.assert_called_once_with(mock.ANY, wait=False)
+    mock_shutdown.call_args.args[0].shutdown()
+    assert item.executor is None
+    assert item.poll()
+    assert isinstance(item.exception, ValueError)
+    assert item.get_return() is None
+    assert item.show("1") == "1 - fail (failed: ValueError)"
+
+
+def test_background_function_cancelled():
+    future = Future()
+    executor = mock.Mock()
+    executor.submit.return_value = future
+    item = FunctionItem("add", add, args=[2, 2], executor=executor)
+    item.action()
+    future.cancel()
+    assert item.poll()
+    assert not item.running
+    assert item.exception is None
+    assert item.get_return() is None
+    assert item.show("1") == "1 - add"
+
+
+async def add_later(two, two_two):
+    await asyncio.sleep(0)
+    return two + two_two
+
+
+def test_coroutine_function():
+    item = FunctionItem("add", add_later, args=[2, 2])
+    assert not item._runs_in_background()
+    item.action()
+    assert item.get_return() == 4
+
+
+def test_background_coroutine_function():
+    item = FunctionItem("add", add_later, args=[2, 2], background=True)
+    item.action()
+    assert item.future is not None
+    item.future.result()
+    assert item.poll()
+    assert item.get_return() == 4
+
+
+def test_coroutine_function_task(mock_externalitem_curses):
+    item = FunctionItem("add", add_later, args=[2, 2])
+
+    async def run():
+        item.set_up()
+        item.action()
+        item.clean_up()
+        assert isinstance(item.future, asyncio.Future)
+        assert not item.poll()
+        await item.future
+        assert item.poll()
+
+    asyncio.run(run())
+    mock_externalitem_curses.endwin.assert_not_called()
+    assert item.get_return() == 4
+
+
+def test_coroutine_function_process_pool():
+    with ProcessPoolExecutor(max_workers=1) as executor:
+        with pytest.raises(TypeError):
+            FunctionItem("add", add_later, executor=executor)
+        # Ordinary functions can still be sent to other processes
+        assert FunctionItem("add", add, executor=executor).background
+    assert FunctionItem("add", add_later, executor=mock.Mock()).background
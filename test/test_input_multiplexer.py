@@ -0,0 +1,133 @@
+import os
+import threading
+
+import pytest
+
+from cursesmenu import CursesMenu
+from cursesmenu.input_multiplexer import InputMultiplexer
+
+
+@pytest.fixture
+def window(mock_cursesmenu_curses):
+    window = mock_cursesmenu_curses.mock_window
+    CursesMenu.stdscr = window
+    return window
+
+
+def test_timeout(window):
+    multiplexer = InputMultiplexer()
+    menu = CursesMenu()
+    multiplexer.get_input(menu, -1)
+    window.timeout.assert_not_called()
+
+    multiplexer.halfdelay(5)
+    multiplexer.get_input(menu, -1)
+    window.timeout.assert_called_once_with(500)
+    # The menu can still wait less
+    multiplexer.get_input(menu, 100)
+    window.timeout.assert_called_with(100)
+    multiplexer.get_input(menu, 1000)
+    window.timeout.assert_called_with(500)
+
+
+def test_input_for_active_menu(window, mock_cursesmenu_curses):
+    multiplexer = InputMultiplexer()
+    menu = CursesMenu()
+    submenu = CursesMenu()
+    multiplexer.activate(menu)
+
+    def activate_submenu():
+        # While the menu is already waiting for a key
+        multiplexer.activate(submenu)
+        return ord("a")
+
+    window.getch.side_effect = activate_submenu
+    assert multiplexer.get_input(menu, -1) == -1
+    mock_cursesmenu_curses.ungetch.assert_called_once_with(ord("a"))
+
+    window.getch.side_effect = lambda: ord("b")
+    assert multiplexer.get_input(submenu, -1) == ord("b")
+
+    # The menu waits until it's active again
+    inputs = []
+
+    def get_input():
+        inputs.append(multiplexer.get_input(menu, -1))
+
+    thread = threading.Thread(target=get_input)
+    thread.start()
+    thread.join(timeout=0.05)
+    assert thread.is_alive()
+    multiplexer.activate(None)
+    thread.join(timeout=10)
+    assert inputs == [ord("b")]
+
+
+def test_read_key(window):
+    multiplexer = InputMultiplexer()
+    window.getch.side_effect = lambda: ord("a")
+    # Whichever menu is active
+    multiplexer.activate(CursesMenu())
+    assert multiplexer.read_key(window, 0) == ord("a")
+    window.timeout.assert_called_once_with(0)
+    assert multiplexer.window_timeout == 0
+
+
+@pytest.fixture
+def watched():
+    """A multiplexer that waits for keys on a pipe, and the pipe's write end."""
+    multiplexer = InputMultiplexer()
+    read_fd, write_fd = os.pipe()
+    assert not multiplexer.can_wake
+    assert multiplexer.wakeup_fd is None
+    multiplexer.watch(read_fd)
+    yield multiplexer, write_fd
+    multiplexer.watch(None)
+    assert not multiplexer.can_wake
+    # The pipe is kept for the next time
+    assert multiplexer.wakeup_fd is not None
+    for fd in (read_fd, write_fd, *multiplexer._wakeup):
+        os.close(fd)
+
+
+def test_wake(window, watched):
+    multiplexer, _ = watched
+    assert multiplexer.can_wake
+    window.getch.side_effect = lambda: -1
+    # While it's waiting
+    timer = threading.Timer(0.01, multiplexer.wake)
+    timer.start()
+    assert multiplexer.read_key(window, -1) == -1
+    timer.join()
+    window.getch.assert_called_once_with()
+    window.timeout.assert_called_once_with(0)
+
+    # Before it waits, more than once
+    for _ in range(3):
+        multiplexer.wake()
+    assert multiplexer.read_key(window, -1) == -1
+    # And only then
+    assert multiplexer.read_key(window, 10) == -1
+    assert window.getch.call_count == 3
+    window.timeout.assert_called_once_with(0)
+
+
+def test_wake_pipe_full(window, watched):
+    multiplexer, _ = watched
+    window.getch.side_effect = lambda: -1
+    for _ in range(100000):
+        multiplexer.wake()
+    assert multiplexer.read_key(window, -1) == -1
+    assert multiplexer.read_key(window, 0) == -1
+
+
+def test_watched_key(window, watched):
+    multiplexer, write_fd = watched
+    keys = [-1, ord("a")]
+    window.getch.side_effect = lambda: keys.pop(0)
+    os.write(write_fd, b"a")
+    assert multiplexer.read_key(window, -1) == ord("a")
+
+    # One that curses already has doesn't wait for the pipe
+    window.getch.side_effect = lambda: ord("b")
+    assert multiplexer.read_key(window, -1) == ord("b")
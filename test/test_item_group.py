@@ -1,7 +1,9 @@
+from unittest import mock
+
 import pytest
 
 from cursesmenu import CursesMenu
-from cursesmenu.item_group import ItemGroup
+from cursesmenu.item_group import ChainedItemGroups, ItemGroup, VirtualItemGroup
 from cursesmenu.items import MenuItem
 
 
@@ -80,3 +82,140 @@ def test_eq(sample_item_list):
     )
 
     assert sample_item_list == item_list_5
+
+
+def test_chained_groups(sample_menu, sample_items):
+    first = ItemGroup(sample_menu, sample_items)
+    second = ItemGroup(sample_menu, [MenuItem("Item 7")])
+    chain = ChainedItemGroups(sample_menu, first, ItemGroup(sample_menu), second)
+    assert len(chain) == 3
+    assert list(chain) == [*sample_items, second[0]]
+    assert chain[0] is sample_items[0]
+    assert chain[2] is second[0]
+    assert chain[-1] is second[0]
+    assert chain[-3] is sample_items[0]
+    assert chain[1:] == [sample_items[1], second[0]]
+    with pytest.raises(IndexError):
+        chain[3]
+    with pytest.raises(IndexError):
+        chain[-4]
+
+    new_item = MenuItem("Item 8")
+    first.append(new_item)
+    assert len(chain) == 4
+    assert chain[2] is new_item
+
+
+def test_chained_groups_like_group(sample_menu, sample_items):
+    first = ItemGroup(sample_menu, sample_items)
+    second = ItemGroup(sample_menu, [MenuItem("Item 7")])
+    chain = ChainedItemGroups(sample_menu, first, second)
+    combined = first + second
+    assert chain == combined
+    assert combined == chain
+    assert chain == ChainedItemGroups(sample_menu, combined)
+    assert chain == [*sample_items, second[0]]
+    assert chain != sample_items
+    assert chain != ChainedItemGroups(CursesMenu(), first, second)
+    assert chain != 1
+
+    new_item = MenuItem("Item 8")
+    added = chain + ItemGroup(sample_menu, [new_item])
+    assert isinstance(added, ItemGroup)
+    assert added.menu is sample_menu
+    assert list(added) == [*combined, new_item]
+
+
+def test_add(sample_item_list, sample_menu):
+    new_item = MenuItem("Item 9")
+    combined = sample_item_list + ItemGroup(sample_menu, [new_item])
+    assert combined.menu is sample_menu
+    assert list(combined) == [*sample_item_list, new_item]
+
+
+def test_batch(sample_item_list, sample_menu):
+    new_items = [MenuItem(f"Item {i}") for i in range(10)]
+    with mock.patch.object(sample_menu, "adjust_screen_size") as adjust_screen_size:
+        with sample_item_list.batch():
+            for item in new_items:
+                sample_item_list.append(item)
+            with sample_item_list.batch():
+                del sample_item_list[0]
+            adjust_screen_size.assert_not_called()
+        adjust_screen_size.assert_called_once()
+
+        adjust_screen_size.reset_mock()
+        with sample_item_list.batch():
+            pass
+        adjust_screen_size.assert_not_called()
+
+    assert sample_item_list[-10:] == ItemGroup(sample_menu, new_items)
+    assert all(item.menu is sample_menu for item in new_items)
+
+
+def test_bulk_methods(sample_item_list, sample_menu):
+    new_items = [MenuItem(f"Item {i}") for i in range(10)]
+    with mock.patch.object(sample_menu, "adjust_screen_size") as adjust_screen_size:
+        sample_item_list.extend(iter(new_items))
+        adjust_screen_size.assert_called_once()
+        assert sample_item_list[2:] == ItemGroup(sample_menu, new_items)
+        assert all(item.menu is sample_menu for item in new_items)
+
+        adjust_screen_size.reset_mock()
+        sample_item_list.replace_all(item for item in new_items[:3])
+        adjust_screen_size.assert_called_once()
+        assert sample_item_list == ItemGroup(sample_menu, new_items[:3])
+
+
+def test_threadsafe_methods(sample_item_list, sample_menu):
+    new_items = [MenuItem(f"Item {i}") for i in range(3)]
+    with mock.patch.object(sample_menu, "post") as post:
+        sample_item_list.append_threadsafe(new_items[0])
+        sample_item_list.extend_threadsafe(iter(new_items[1:]))
+        assert len(sample_item_list) == 2
+        for call in post.call_args_list:
+            call.args[0]()
+    assert sample_item_list[2:] == ItemGroup(sample_menu, new_items)
+
+
+def test_virtual_group(sample_menu):
+    rows = [f"row{i}" for i in range(100)]
+    factory = mock.Mock(side_effect=lambda index, row: MenuItem(f"{index}: {row}"))
+    group = VirtualItemGroup(sample_menu, rows, factory, cache_size=10)
+
+    assert len(group) == 100
+    assert group.texts() == rows
+    factory.assert_not_called()
+    assert group[5].text == "5: row5"
+    assert group[5] is group[5]
+    assert group[-1].text == "99: row99"
+    assert group[5].menu is sample_menu
+    assert factory.call_count == 2
+    with pytest.raises(IndexError):
+        group[100]
+    with pytest.raises(IndexError):
+        group[-101]
+
+    assert [item.text for item in group[10:12]] == ["10: row10", "11: row11"]
+    assert len(list(group)) == 100
+    assert len(group._cache) == 10
+    assert len(group + ItemGroup(sample_menu, [MenuItem("extra")])) == 101
+
+    rows.append("new row")
+    with mock.patch.object(sample_menu, "adjust_screen_size") as adjust_screen_size:
+        group.refresh()
+        adjust_screen_size.assert_called_once()
+    assert len(group._cache) == 0
+    assert group[100].text == "100: new row"
+
+
+def test_virtual_group_read_only(sample_menu):
+    group = VirtualItemGroup(sample_menu, ["row"], mock.Mock())
+    with pytest.raises(TypeError):
+        group.append(MenuItem("item"))
+    with pytest.raises(TypeError):
+        group.extend([MenuItem("item")])
+    with pytest.raises(TypeError):
+        group[0] = MenuItem("item")
+    with pytest.raises(TypeError):
+        del group[0]
@@ -1,7 +1,15 @@
 import pytest
 
 from cursesmenu import CursesMenu
-from cursesmenu.items import MenuItem
+from cursesmenu.items import (
+    CommandItem,
+    ExitItem,
+    ExternalItem,
+    FunctionItem,
+    MenuItem,
+    SubmenuItem,
+)
+from cursesmenu.items.selection_item import SelectionItem
 
 
 @pytest.fixture
@@ -31,6 +39,14 @@ def test_show(basic_item: MenuItem):
     assert basic_item.show("1") == "1 - item"
 
 
+def test_show_changes(basic_item: MenuItem):
+    assert basic_item.show("2") == "2 - item"
+    basic_item.text = "changed"
+    assert basic_item.show("2") == "2 - changed"
+    basic_item.override_index = "c"
+    assert basic_item.show("2") == "c - changed"
+
+
 def test_set_up(basic_item: MenuItem):
     basic_item.set_up()
 
@@ -41,3 +57,32 @@ def test_action(basic_item: MenuItem):
 
 def test_clean_up(basic_item: MenuItem):
     basic_item.clean_up()
+
+
+@pytest.mark.parametrize(
+    "item",
+    [
+        MenuItem("item"),
+        ExitItem(),
+        ExternalItem("item"),
+        FunctionItem("item", print),
+        CommandItem("item", "echo"),
+        SelectionItem("item", 0),
+        SubmenuItem("item"),
+    ],
+)
+def test_slots(item: MenuItem):
+    assert not hasattr(item, "__dict__")
+    with pytest.raises(AttributeError):
+        item.extra = 1  # type: ignore[attr-defined]
+
+
+def test_subclass_without_slots():
+    class CustomItem(MenuItem):
+        def __init__(self, text: str) -> None:
+            super().__init__(text)
+            self.extra = 1
+
+    item = CustomItem("item")
+    assert item.extra == 1
+    assert item.show("1") == "1 - item"
@@ -0,0 +1,176 @@
+import asyncio
+import os
+import threading
+from collections import deque
+from unittest import mock
+
+import pytest
+
+from cursesmenu import CursesMenu
+from cursesmenu.input_multiplexer import InputMultiplexer
+from cursesmenu.items import FunctionItem, MenuItem, SubmenuItem
+from cursesmenu.navigator import MenuNavigator
+
+pytestmark = pytest.mark.usefixtures(
+    "mock_cursesmenu_curses",
+    "mock_clear",
+    "mock_externalitem_curses",
+)
+
+
+@pytest.fixture
+def pending_keys(mock_cursesmenu_curses):
+    """Keys that getch returns, including ones given back with ungetch."""
+    keys = deque()
+    mock_cursesmenu_curses.ungetch.side_effect = keys.appendleft
+    CursesMenu.stdscr = mock_cursesmenu_curses.mock_window
+    CursesMenu.stdscr.getch.side_effect = lambda: keys.popleft() if keys else -1
+    return keys
+
+
+@pytest.fixture
+def stdin(pending_keys):
+    """Feed keys to the menus through a pipe that stands in for stdin."""
+    read_fd, write_fd = os.pipe()
+    os.set_blocking(read_fd, False)
+
+    def getch():
+        if pending_keys:
+            return pending_keys.popleft()
+        try:
+            return os.read(read_fd, 1)[0]
+        except BlockingIOError:
+            return -1
+
+    CursesMenu.stdscr.getch.side_effect = getch
+    # Waiting for keys on the pipe, so that posts can wake the menus up
+    multiplexer = InputMultiplexer()
+    stdin_fd = mock.patch("cursesmenu.curses_menu._stdin_fd", return_value=read_fd)
+    with mock.patch("cursesmenu.navigator.sys") as mock_sys:
+        mock_sys.stdin.fileno.return_value = read_fd
+        with mock.patch.object(CursesMenu, "input_multiplexer", multiplexer), stdin_fd:
+            yield lambda keys: os.write(write_fd, keys.encode())
+    os.close(read_fd)
+    os.close(write_fd)
+    for end in multiplexer._wakeup or ():
+        os.close(end)
+
+
+async def get_seven(started):
+    started.set()
+    await asyncio.sleep(0.05)
+    return 7
+
+
+def make_menus(*, should_exit=False):
+    root = CursesMenu("root")
+    submenu = CursesMenu("submenu")
+    submenu.returned_value = 1
+    submenu_item = SubmenuItem("submenu", submenu, root, should_exit=should_exit)
+    root.items.append(submenu_item)
+    return root, submenu, submenu_item
+
+
+def test_run(pending_keys):
+    root, submenu, _ = make_menus()
+    pending_keys.extend(b"1\nq\nq\n")
+
+    navigator = MenuNavigator(root)
+    original_push = navigator.push
+
+    def push(item):
+        assert navigator.active_menu is root
+        original_push(item)
+        assert navigator.active_menu is submenu
+        assert submenu.navigator is navigator
+
+    navigator.push = push
+    navigator.run()
+    assert navigator.active_menu is None
+    assert root.navigator is None
+    assert submenu.navigator is None
+    assert not root.is_running()
+    # Delivered from the submenu, and kept by the exit item
+    assert root.returned_value == 1
+
+
+def test_submenu_return(pending_keys):
+    root, _, _ = make_menus(should_exit=True)
+    pending_keys.extend(b"1\nq\n")
+
+    navigator = MenuNavigator(root)
+    navigator.run()
+    assert navigator.active_menu is None
+    assert root.returned_value == 1
+    assert root.should_exit
+
+
+def test_show_async(stdin):
+    root, _, _ = make_menus()
+    started = asyncio.Event()
+    root.items.insert(0, FunctionItem("get_seven", get_seven, args=[started]))
+
+    async def run():
+        stdin("1\n")
+        shown = asyncio.ensure_future(root.show_async())
+        await started.wait()
+        # The menu can still be used while the coroutine runs
+        stdin("2\n")
+        await asyncio.sleep(0.01)
+        assert root.navigator is not None
+        assert root.navigator.active_menu is root.items[1].submenu
+        stdin("q\n")
+        # Delivered once the menu polls it, after the submenu's return value
+        while root.returned_value != 7:  # noqa: ASYNC110
+            await asyncio.sleep(0.01)
+        stdin("q\n")
+        return await shown
+
+    assert asyncio.run(run()) == 7
+    assert root.navigator is None
+
+
+def test_show_async_post(stdin):
+    root, _, _ = make_menus()
+
+    async def run():
+        shown = asyncio.ensure_future(root.show_async())
+        await asyncio.sleep(0.01)
+        # Shown without waiting for a key
+        threading.Thread(
+            target=root.items.append_threadsafe,
+            args=[MenuItem("posted")],
+        ).start()
+        for _ in range(1000):  # pragma: no branch
+            if len(root.items) == 2:
+                break
+            await asyncio.sleep(0.01)
+        assert len(root.items) == 2
+        stdin("q\n")
+        return await shown
+
+    assert asyncio.run(run()) is None
+
+
+def test_show_async_submenu(stdin):
+    _, submenu, _ = make_menus()
+    submenu.returned_value = 1
+    stdin("q\n")
+    assert asyncio.run(submenu.show_async()) == 1
+
+
+def test_join_submenu(pending_keys):
+    root, submenu, _ = make_menus()
+    # Never started, so there's nothing to wait for
+    assert submenu.join() == 1
+    pending_keys.extend(b"1\n")
+    root.start()
+    assert submenu.wait_for_start(timeout=10)
+    assert submenu.is_alive()
+    assert submenu.join(timeout=0.01) == 1
+    assert submenu.is_alive()
+
+    assert submenu.exit(timeout=10) == 1
+    assert not submenu.is_alive()
+    assert root.exit(timeout=10) == 1
+    assert not root.is_alive()
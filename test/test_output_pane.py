@@ -0,0 +1,89 @@
+import subprocess
+from unittest import mock
+
+import pytest
+
+from cursesmenu.output_pane import OutputPane
+
+pytestmark = pytest.mark.usefixtures("mock_output_pane_curses")
+
+
+@pytest.fixture
+def window(mock_output_pane_curses):
+    window = mock_output_pane_curses.mock_window
+    window.getmaxyx.return_value = (10, 20)
+    return window
+
+
+def finished_process(lines, returncode=0):
+    process = mock.Mock()
+    process.stdout = lines
+    process.poll.return_value = returncode
+    process.returncode = returncode
+    return process
+
+
+def shown_lines(window):
+    return [c.args[2] for c in window.addstr.call_args_list if c.args[0] not in (1, 8)]
+
+
+def test_feed():
+    pane = OutputPane("pane", max_lines=3)
+    pane.feed(["one\n", "two\ttab\r\n", "\x1b[1mbold\n", "four"])
+    assert list(pane.lines) == ["two     tab", "?[1mbold", "four"]
+    assert pane.line_count == 4
+
+
+def test_scroll():
+    pane = OutputPane("pane")
+    pane.feed(str(i) for i in range(10))
+    pane.scroll(-1, 4)
+    assert pane.top == 5
+    pane.scroll(-10, 4)
+    assert pane.top == 0
+    pane.scroll(6, 4)
+    assert pane.top is None
+
+
+def test_draw(window):
+    pane = OutputPane("pane", max_lines=8)
+    pane.feed(f"line {i}" for i in range(10))
+    pane.draw(window, "status")
+    # Six lines fit between the title and the status
+    assert shown_lines(window) == [f"line {i}" for i in range(4, 10)]
+    window.addstr.assert_any_call(8, 2, "status (2 earlie", mock.ANY)
+
+    window.addstr.reset_mock()
+    pane.top = 0
+    pane.draw(window, "status")
+    assert shown_lines(window) == [f"line {i}" for i in range(2, 8)]
+
+
+def test_run(window, mock_output_pane_curses):
+    curses = mock_output_pane_curses
+    keys = [-1, curses.KEY_UP, curses.KEY_HOME, curses.KEY_PPAGE, curses.KEY_END]
+    window.getch.side_effect = [*keys, curses.KEY_NPAGE, curses.KEY_DOWN, ord("\n")]
+    pane = OutputPane("pane")
+    process = finished_process([f"line {i}\n" for i in range(10)], 3)
+    assert pane.run(window, process) == 3
+    assert pane.top is None
+    window.addstr.assert_any_call(8, 2, "Exited with stat", mock.ANY)
+
+
+def test_run_stop(window):
+    window.getch.side_effect = [ord("\n"), ord("q")]
+    pane = OutputPane("pane")
+    process = finished_process([], None)
+    pane.run(window, process)
+    process.terminate.assert_called_once()
+    window.addstr.assert_any_call(8, 2, "Running, press q", mock.ANY)
+
+
+def test_run_kill(window):
+    window.getch.side_effect = [ord("q")]
+    pane = OutputPane("pane")
+    process = finished_process([], None)
+    process.wait.side_effect = [subprocess.TimeoutExpired("cmd", 5), -9]
+    pane.run(window, process)
+    process.terminate.assert_called_once()
+    process.kill.assert_called_once()
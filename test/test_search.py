@@ -0,0 +1,211 @@
+from concurrent.futures import Future, ThreadPoolExecutor
+from unittest import mock
+
+import pytest
+
+from cursesmenu import CursesMenu, ItemGroup
+from cursesmenu.item_group import VirtualItemGroup
+from cursesmenu.items import MenuItem
+from cursesmenu.search import (
+    FuzzyFilter,
+    ItemFilter,
+    TrigramIndex,
+    fuzzy_pattern,
+    fuzzy_score,
+    is_subsequence,
+)
+
+pytestmark = pytest.mark.usefixtures("mock_cursesmenu_curses", "mock_clear")
+
+TEXTS = ["Apple", "Banana", "Pineapple", "apricot", "Grape"]
+
+
+@pytest.fixture
+def group():
+    return ItemGroup(CursesMenu(), [MenuItem(text) for text in TEXTS])
+
+
+def test_trigram_index():
+    index = TrigramIndex(TEXTS)
+    assert index.search("") == [0, 1, 2, 3, 4]
+    assert index.search("ap") == [0, 2, 3, 4]
+    assert index.search("APP") == [0, 2]
+    assert index.search("apple") == [0, 2]
+    assert index.search("ape") == [4]
+    assert index.search("xyz") == []
+
+
+def test_filter(group: ItemGroup):
+    item_filter = ItemFilter(group)
+    assert list(item_filter) == list(group)
+
+    item_filter.query = "a"
+    assert len(item_filter) == 5
+    item_filter.query = "ap"
+    assert item_filter.matches == [0, 2, 3, 4]
+    item_filter.query = "App"
+    assert [item.text for item in item_filter] == ["Apple", "Pineapple"]
+    assert item_filter[1] is group[2]
+    assert item_filter[:1] == [group[0]]
+
+    # Shorter queries are remembered
+    with mock.patch.object(item_filter, "_texts", []):
+        item_filter.query = "ap"
+        assert item_filter.matches == [0, 2, 3, 4]
+
+
+def test_filter_index(group: ItemGroup):
+    item_filter = ItemFilter(group, "ana")
+    assert item_filter.query == "ana"
+    assert item_filter.matches == [1]
+    index = item_filter._index
+    assert index is not None
+
+    item_filter.query = "rap"
+    assert item_filter.matches == [4]
+    assert item_filter._index is index
+
+    item_filter.query = "ap"
+    assert item_filter.matches == [0, 2, 3, 4]
+
+
+def test_filter_index_background(group: ItemGroup):
+    futures: list[Future[TrigramIndex]] = [Future(), Future(), Future()]
+    executor = mock.Mock()
+    executor.submit.side_effect = futures
+    item_filter = ItemFilter(group, "ana", executor)
+    # Every item is checked until the index is ready
+    assert item_filter.matches == [1]
+    executor.submit.assert_called_once_with(TrigramIndex, item_filter._texts)
+    assert item_filter._index is None
+
+    index = TrigramIndex(item_filter._texts)
+    futures[0].set_result(index)
+    item_filter.query = "rap"
+    assert item_filter.matches == [4]
+    assert item_filter._index is index
+
+    # A new one is built when the group changes
+    group.append(MenuItem("grapefruit"))
+    assert item_filter.matches == [4, 5]
+    # Or on the caller's thread if the executor was shut down first
+    futures[1].cancel()
+    item_filter.query = "fru"
+    assert item_filter.matches == [5]
+    assert item_filter._index is not None
+
+    # Closing the filter stops it from being built
+    group.append(MenuItem("fruit"))
+    assert item_filter.matches == [5, 6]
+    item_filter.cancel()
+    assert futures[2].cancelled()
+
+
+def test_filter_group_changes(group: ItemGroup):
+    item_filter = ItemFilter(group, "grape")
+    assert item_filter.matches == [4]
+    group.insert(0, MenuItem("grapefruit"))
+    assert item_filter.matches == [0, 5]
+    del group[0]
+    assert item_filter.matches == [4]
+
+
+def test_filter_virtual_group():
+    factory = mock.Mock(side_effect=lambda _, row: MenuItem(row.upper()))
+    group = VirtualItemGroup(CursesMenu(), TEXTS, factory, row_text=str.upper)
+    item_filter = ItemFilter(group, "app")
+    assert item_filter.matches == [0, 2]
+    # The items are only created for the matches that are used
+    factory.assert_not_called()
+    assert item_filter[1].text == "PINEAPPLE"
+    factory.assert_called_once_with(2, "Pineapple")
+
+
+def test_base_filter_is_never_pending(group: ItemGroup):
+    item_filter = ItemFilter(group, "ap")
+    assert not item_filter.pending
+    assert not item_filter.poll()
+    item_filter.cancel()
+    assert item_filter.matches == [0, 2, 3, 4]
+
+
+def test_fuzzy_score():
+    assert fuzzy_score("", "anything") == 0
+    assert fuzzy_score("abc", "acb") is None
+    # Word starts and consecutive characters score higher than scattered ones
+    assert fuzzy_score("fb", "foo_bar") > fuzzy_score("fb", "foobar")  # type: ignore[operator]
+    assert fuzzy_score("foo", "foobar") > fuzzy_score("foo", "fxoxo")  # type: ignore[operator]
+    # The tightest match is scored, not the leftmost
+    assert fuzzy_score("ab", "a___ab") == fuzzy_score("ab", "ab")
+    assert fuzzy_score("ab", "xa.b", fuzzy_pattern("ab")) == fuzzy_score("ab", "xa.b")
+
+
+def test_is_subsequence():
+    assert is_subsequence("", "abc")
+    assert is_subsequence("ac", "abc")
+    assert not is_subsequence("ca", "abc")
+
+
+def test_fuzzy_filter(group: ItemGroup):
+    item_filter = FuzzyFilter(group)
+    assert list(item_filter) == list(group)
+    assert not item_filter.pending
+
+    item_filter.query = "ape"
+    # Apple starts with the a, Grape has the letters together
+    assert [item.text for item in item_filter] == ["Apple", "Grape", "Pineapple"]
+
+    # Only the matches for the shorter query are scored
+    with mock.patch.object(item_filter, "_rank", wraps=item_filter._rank) as rank:
+        item_filter.query = "aple"
+        assert [item.text for item in item_filter] == ["Apple", "Pineapple"]
+        assert sorted(rank.call_args.args[2]) == [0, 2, 4]
+        rank.reset_mock()
+        item_filter.query = "ape"
+        assert len(item_filter) == 3
+        rank.assert_not_called()
+
+
+def test_fuzzy_filter_background(group: ItemGroup):
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        item_filter = FuzzyFilter(group, "ana", executor)
+        # The old matches are shown until the new ones are collected
+        assert len(item_filter) == 5
+        assert item_filter.pending
+        assert item_filter._pending is not None
+        item_filter._pending.result(timeout=10)
+        assert item_filter.poll()
+        assert not item_filter.pending
+        assert not item_filter.poll()
+        assert [item.text for item in item_filter] == ["Banana"]
+
+        # Searching for the same thing again doesn't start over
+        item_filter.query = "grp"
+        pending = item_filter._pending
+        item_filter.query = "grp"
+        assert item_filter._pending is pending
+
+        # Neither does searching for something that's already known
+        item_filter.query = "ana"
+        assert not item_filter.pending
+        assert [item.text for item in item_filter] == ["Banana"]
+
+        # The group changing abandons the search
+        item_filter.query = "grp"
+        group.append(MenuItem("grapefruit"))
+        assert item_filter.matches == [0, 1, 2, 3, 4, 5]
+        assert item_filter.pending
+        assert item_filter._pending is not None
+        item_filter._pending.result(timeout=10)
+        assert item_filter.poll()
+        assert [item.text for item in item_filter] == ["Grape", "grapefruit"]
+
+
+def test_fuzzy_filter_abandoned(group: ItemGroup):
+    item_filter = FuzzyFilter(group)
+    assert len(item_filter) == 5
+    generation = item_filter._generation
+    texts = item_filter._texts
+    assert item_filter._rank("a", texts, [0, 1], generation) == [0, 1]
+    item_filter.cancel()
+    assert item_filter._rank("a", texts, [0, 1], generation) is None
@@ -11,3 +11,44 @@ def test_get_selection():
     with mock.patch("cursesmenu.curses_menu.CursesMenu.get_input") as f:
         f.return_value = ord("\n")
         assert CursesMenu.get_selection(["thing1", "thing2"], "title", "subtitle") == 0
+
+
+def test_get_selection_viewport_rendering():
+    with mock.patch("cursesmenu.curses_menu.CursesMenu.get_input") as f:
+        f.return_value = ord("\n")
+        selection = CursesMenu.get_selection(
+            [f"thing{i}" for i in range(100)],
+            viewport_rendering=True,
+        )
+        assert selection == 0
+
+
+def test_lazy_selection_menu(mock_cursesmenu_curses):
+    mock_cursesmenu_curses.mock_window.getmaxyx.return_value = (10, 40)
+    selections = [f"thing{i}" for i in range(100000)]
+    menu = CursesMenu.make_selection_menu(selections, lazy=True)
+    assert menu.viewport_rendering
+    assert len(menu.items) == 100000
+    assert len(menu.items._cache) == 0
+
+    menu.start()
+    menu.wait_for_start(timeout=10)
+    menu.go_up()
+    assert menu.current_item is menu.items[-1]
+    assert len(menu.items._cache) < 20
+    menu.select()
+    menu.join(timeout=10)
+    assert menu.returned_value == 99999
+
+
+def test_get_selection_lazy():
+    with mock.patch("cursesmenu.curses_menu.CursesMenu.get_input") as f:
+        f.return_value = ord("\n")
+        assert CursesMenu.get_selection(["thing1", "thing2"], lazy=True) == 0
+
+
+def test_get_selection_fuzzy():
+    with mock.patch("cursesmenu.curses_menu.CursesMenu.get_input") as f:
+        keys = iter([ord("/"), ord("t"), ord("2"), ord("\n")])
+        f.side_effect = lambda: next(keys)
+        assert CursesMenu.get_selection(["thing1", "thing2"], fuzzy=True) == 1
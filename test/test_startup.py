@@ -0,0 +1,60 @@
+import os
+import subprocess
+import sys
+from importlib import metadata
+
+import pytest
+
+import cursesmenu
+import cursesmenu.items
+
+# Modules that take a while to import, and that a menu doesn't need until it uses them
+SLOW_MODULES = [
+    "asyncio",
+    "concurrent.futures",
+    "importlib.metadata",
+    "subprocess",
+]
+
+
+def run_python(code, *args):
+    # Without the coverage of subprocesses, which imports modules before the code runs
+    env = {
+        name: value
+        for name, value in os.environ.items()
+        if not name.startswith("COV_CORE_") and name != "COVERAGE_PROCESS_START"
+    }
+    return subprocess.run(
+        [sys.executable, *args, "-c", code],
+        capture_output=True,
+        check=True,
+        env=env,
+        text=True,
+    )
+
+
+def test_lazy_imports():
+    # Everything that's done before the first frame is drawn
+    code = f"""
+import sys
+import cursesmenu
+from cursesmenu.items import ExitItem, MenuItem
+
+menu = cursesmenu.CursesMenu("title", "subtitle")
+menu.items.append(MenuItem("item"))
+menu.all_items[0].show(menu._get_index_text(0))
+print(",".join(name for name in {SLOW_MODULES!r} if name in sys.modules))
+"""
+    assert run_python(code).stdout.strip() == ""
+
+
+def test_lazy_attributes(monkeypatch):
+    assert cursesmenu.__version__ == metadata.version("curses-menu")
+    monkeypatch.delattr(cursesmenu, "items")
+    assert cursesmenu.items is sys.modules["cursesmenu.items"]
+    assert cursesmenu.items.CommandItem.__name__ == "CommandItem"
+    assert "CommandItem" in dir(cursesmenu.items)
+    with pytest.raises(AttributeError):
+        _ = cursesmenu.missing
+    with pytest.raises(AttributeError):
+        _ = cursesmenu.items.MissingItem
@@ -1,3 +1,7 @@
+import threading
+import time
+from collections import deque
+
 import pytest
 
 from cursesmenu import CursesMenu
@@ -70,6 +74,39 @@ def test_submenu():
     assert not submenu2.is_running()
 
 
+def test_submenu_on_same_thread(mock_cursesmenu_curses):
+    root_menu = CursesMenu("root_menu", "test_action")
+    submenu = CursesMenu("submenu", "test_action")
+    root_menu.items.append(SubmenuItem("submenu_item", submenu, menu=root_menu))
+
+    keys = deque()
+
+    def getch():
+        if keys:
+            return keys.popleft()
+        time.sleep(0.001)
+        return -1
+
+    mock_cursesmenu_curses.mock_window.getch.side_effect = getch
+    mock_cursesmenu_curses.ungetch.side_effect = keys.appendleft
+    threads = threading.active_count()
+
+    root_menu.start()
+    root_menu.wait_for_start(timeout=10)
+    keys.extend(b"1\n")
+    submenu.wait_for_start(timeout=10)
+    assert submenu.is_alive()
+    assert submenu.navigator is root_menu.navigator
+    assert threading.active_count() == threads + 1
+
+    keys.extend(b"q\n")
+    root_menu.wait_for_start(timeout=10)
+    assert submenu.navigator is None
+    assert not submenu.is_alive()
+    root_menu.exit()
+    assert not root_menu.is_alive()
+
+
 def test_null_submenu():
     root_menu = CursesMenu("root_menu", "test_action")
     submenu1 = CursesMenu("submenu1", "test_action")